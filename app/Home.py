@@ -1,27 +1,26 @@
 """Streamlit entrypoint that configures the application shell."""
 from __future__ import annotations
 
+from datetime import datetime
+
 import streamlit as st
 
 from app.components.forms import render_sidebar
+from app.settings import PAGE_ICON, PAGE_LAYOUT, PAGE_TITLE
 from app.state.session import handle_full_reset
 from app.utils.cache import load_dag40_cached
-from app.utils.time_windows import current_time_window
+from app.utils.time_windows import TZ, current_time_window
 
 
 def main() -> None:
-    st.set_page_config(
-        page_title="Geração de Notas de Cobrança - Painel de Solicitações",
-        page_icon="🧾",
-        layout="wide",
-    )
+    st.set_page_config(page_title=PAGE_TITLE, page_icon=PAGE_ICON, layout=PAGE_LAYOUT)
 
     handle_full_reset()
 
-    st.title("Geração de Notas de Cobrança - Painel de Solicitações")
+    st.title(PAGE_TITLE)
     st.caption("Solicite a geração de notas por UTD, TURMA e BASE, com validações operacionais de horário.")
 
-    window = current_time_window()
+    window = current_time_window(datetime.now(TZ))
     if window.after_10:
         st.info(
             "⚠️ **Após 10:30 só serão aceitos pedidos para amanhã ou fim de semana. Pedidos para a cadeia noturna só serão aceitos até às 14:30**",
@@ -1,7 +1,7 @@
 """Reusable editor components."""
 from __future__ import annotations
 
-from typing import Iterable, Mapping
+from typing import Iterable, Mapping, Sequence
 
 import pandas as pd
 import streamlit as st
@@ -30,35 +30,57 @@ COLUMNS_SHOW = [
     "COMENTARIO",
 ]
 
+_ROW_COLUMNS = frozenset(COLUMNS_ALL)
+_EDITABLE_COLUMNS = frozenset(COLUMNS_SHOW)
+
+
+_REQUEST_DTYPES = {column: "Int64" if column == "PACOTES" else "string" for column in COLUMNS_ALL}
+
 
 def _empty_request_df() -> pd.DataFrame:
-    df = pd.DataFrame(columns=COLUMNS_ALL)
-    df["PACOTES"] = pd.Series(dtype="int")
-    for column in COLUMNS_ALL:
-        if column != "PACOTES":
-            df[column] = pd.Series(dtype="string")
-    return df
+    return pd.DataFrame({column: pd.array([], dtype=dtype) for column, dtype in _REQUEST_DTYPES.items()})
+
+
+def ensure_request_rows() -> None:
+    """Ensure the session state contains the request lines for the editor.
+
+    Lines are kept as a list of row dicts; a DataFrame is only built for the
+    editor and for submission (see :func:`request_lines_dataframe`).
+    """
+
+    if keys.REQUEST_ROWS not in st.session_state:
+        st.session_state[keys.REQUEST_ROWS] = []
+
 
+def request_lines_dataframe() -> pd.DataFrame:
+    """Materialise the request lines stored in the session as a DataFrame."""
 
-def ensure_request_dataframe() -> None:
-    """Ensure the session state contains the base dataframe for the editor."""
+    rows = st.session_state.get(keys.REQUEST_ROWS) or []
+    if not rows:
+        return _empty_request_df()
+    return pd.DataFrame(rows, columns=COLUMNS_ALL)
 
-    if keys.REQUEST_LINES not in st.session_state:
-        st.session_state[keys.REQUEST_LINES] = _empty_request_df()
+
+def _coerce_pacotes(value: object) -> int:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0
+    return int(number) if number == number else 0
 
 
 def request_lines_editor(
-    dag40_df: pd.DataFrame,
+    zona_by_key: Mapping[tuple[str, str, str], str],
     *,
     utds_sel: Iterable[str],
     turma_sel: str | None,
-    geracao_options: list[str],
+    geracao_options: Sequence[str],
     geracao_default: str,
     servicos_opcoes: list[str],
 ) -> None:
     """Render the editable table for request lines."""
 
-    ensure_request_dataframe()
+    ensure_request_rows()
     if not utds_sel or not turma_sel:
         st.info("Selecione UTD(s), a TURMA e ao menos uma BASE para cada UTD.")
         return
@@ -69,43 +91,10 @@ def request_lines_editor(
         return
 
     def _zona_for(utd: str, base: str, turma: str) -> str:
-        subset = dag40_df[(dag40_df["UTD"] == utd) & (dag40_df["BASE"] == base) & (dag40_df["TURMA"] == turma)]
-        return subset["ZONA"].iloc[0] if not subset.empty else ""
-
-    def _ensure_rows_for_selected_pairs() -> None:
-        df = st.session_state[keys.REQUEST_LINES].copy()
-        wanted_keys = set()
-        rows_to_add = []
-        for utd, bases in base_selection.items():
-            for base in bases:
-                key = f"{utd}\n{base}\n{turma_sel}"
-                wanted_keys.add(key)
-                exists = df[(df["UTD"] == utd) & (df["BASE"] == base) & (df["TURMA"] == turma_sel)]
-                if exists.empty:
-                    zona = _zona_for(utd, base, turma_sel)
-                    rows_to_add.append(
-                        {
-                            "UTD": utd,
-                            "BASE": base,
-                            "TURMA": turma_sel,
-                            "GERACAO_PARA": geracao_default,
-                            "SERVIÇO": "",
-                            "PACOTES": 1,
-                            "JUSTIFICATIVA": "",
-                            "COMENTARIO": "",
-                            "ZONA": zona,
-                        }
-                    )
-        if not df.empty:
-            df["KEY"] = df["UTD"].astype(str) + "\n" + df["BASE"].astype(str) + "\n" + df["TURMA"].astype(str)
-            df = df[df["KEY"].isin(wanted_keys)].drop(columns=["KEY"])
-        if rows_to_add:
-            df = pd.concat([df, pd.DataFrame(rows_to_add)], ignore_index=True)
-        st.session_state[keys.REQUEST_LINES] = df
+        return zona_by_key.get((utd, base, turma), "")
 
-    def _add_service_row_for_base(utd: str, base: str, turma: str, zona: str) -> None:
-        df = st.session_state[keys.REQUEST_LINES].copy()
-        new_row = {
+    def _new_row(utd: str, base: str, turma: str, zona: str) -> dict:
+        return {
             "UTD": utd,
             "BASE": base,
             "TURMA": turma,
@@ -116,50 +105,74 @@ def request_lines_editor(
             "COMENTARIO": "",
             "ZONA": zona,
         }
-        st.session_state[keys.REQUEST_LINES] = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-        if keys.REQUEST_EDITOR_KEY in st.session_state:
-            del st.session_state[keys.REQUEST_EDITOR_KEY]
+
+    def _ensure_rows_for_selected_pairs() -> None:
+        rows = st.session_state[keys.REQUEST_ROWS]
+        wanted = [(utd, base, turma_sel) for utd, bases in base_selection.items() for base in bases]
+        wanted_keys = set(wanted)
+        # Tuple keys against a set: no string concatenation, one pass.
+        kept = []
+        present = set()
+        for row in rows:
+            key = (row["UTD"], row["BASE"], row["TURMA"])
+            if key in wanted_keys:
+                kept.append(row)
+                present.add(key)
+        removed_any = len(kept) != len(rows)
+        added_any = False
+        for utd, base, turma in wanted:
+            if (utd, base, turma) not in present:
+                present.add((utd, base, turma))
+                kept.append(_new_row(utd, base, turma, _zona_for(utd, base, turma)))
+                added_any = True
+        if removed_any or added_any:
+            st.session_state[keys.REQUEST_ROWS] = kept
+
+    def _add_service_row_for_base(utd: str, base: str, turma: str, zona: str) -> None:
+        st.session_state[keys.REQUEST_ROWS].append(_new_row(utd, base, turma, zona))
+        st.session_state.pop(keys.REQUEST_EDITOR_KEY, None)
 
     _ensure_rows_for_selected_pairs()
 
     st.subheader("Linhas por BASE", divider=True)
-    with st.container(border=True):
-        cols = st.columns(3)
-        i = 0
-        for utd, bases in base_selection.items():
-            for base in bases:
-                zona_val = _zona_for(utd, base, turma_sel)
-                if cols[i % 3].button(
-                    f"➕ Adicionar serviço • {base} (UTD {utd}, {turma_sel})",
-                    key=f"add_{utd}_{base}",
-                    use_container_width=True,
-                ):
-                    _add_service_row_for_base(utd, base, turma_sel, zona_val)
-                i += 1
+    pairs = [(utd, base) for utd, bases in base_selection.items() for base in bases]
+    # One selectbox + submit button instead of a button per BASE; the form
+    # keeps picking a target from triggering reruns.
+    with st.form("add_service_form", border=True):
+        col_target, col_add = st.columns([3, 1])
+        target = col_target.selectbox(
+            "Adicionar serviço em…",
+            options=pairs,
+            format_func=lambda pair: f"{pair[1]} (UTD {pair[0]}, {turma_sel})",
+        )
+        if col_add.form_submit_button("➕ Adicionar", use_container_width=True) and target:
+            utd, base = target
+            _add_service_row_for_base(utd, base, turma_sel, _zona_for(utd, base, turma_sel))
 
     def _apply_editor_changes() -> None:
         ed_state = st.session_state.get(keys.REQUEST_EDITOR_KEY, {})
-        df = st.session_state[keys.REQUEST_LINES].copy()
-        deleted = ed_state.get("deleted_rows", [])
+        rows = st.session_state[keys.REQUEST_ROWS]
+        deleted = set(ed_state.get("deleted_rows", []))
         if deleted:
-            df = df.drop(df.index[deleted]).reset_index(drop=True)
+            rows = [row for idx, row in enumerate(rows) if idx not in deleted]
         for row_idx, changes in ed_state.get("edited_rows", {}).items():
-            for col, val in changes.items():
-                if col in df.columns and col in COLUMNS_SHOW:
-                    df.at[row_idx, col] = val
-        for new in ed_state.get("added_rows", []):
-            base_row = {column: "" for column in COLUMNS_ALL}
-            base_row.update({
-                "PACOTES": 1,
-                "GERACAO_PARA": geracao_default,
-            })
-            base_row.update({k: v for k, v in new.items() if k in COLUMNS_ALL})
-            df = pd.concat([df, pd.DataFrame([base_row])], ignore_index=True)
-        df["PACOTES"] = pd.to_numeric(df["PACOTES"], errors="coerce").fillna(0).astype(int)
-        st.session_state[keys.REQUEST_LINES] = df
-
-    editor_df = st.session_state[keys.REQUEST_LINES][COLUMNS_SHOW].copy()
-    editor_df["PACOTES"] = pd.to_numeric(editor_df["PACOTES"], errors="coerce").fillna(0).astype(int)
+            if not 0 <= row_idx < len(rows):
+                continue
+            updates = {col: val for col, val in changes.items() if col in _EDITABLE_COLUMNS}
+            if "PACOTES" in updates:
+                updates["PACOTES"] = _coerce_pacotes(updates["PACOTES"])
+            rows[row_idx].update(updates)
+        added = ed_state.get("added_rows", [])
+        if added:
+            template = dict.fromkeys(COLUMNS_ALL, "")
+            template.update({"PACOTES": 1, "GERACAO_PARA": geracao_default})
+            new_rows = [{**template, **{k: v for k, v in new.items() if k in _ROW_COLUMNS}} for new in added]
+            for row in new_rows:
+                row["PACOTES"] = _coerce_pacotes(row["PACOTES"])
+            rows.extend(new_rows)
+        st.session_state[keys.REQUEST_ROWS] = rows
+
+    editor_df = request_lines_dataframe()[COLUMNS_SHOW]
 
     st.data_editor(
         editor_df,
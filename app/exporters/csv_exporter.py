@@ -5,9 +5,12 @@ from dataclasses import dataclass
 from typing import List
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 NUMERIC_COLUMNS = ["CLUSTERS", "QTD_MAX", "QTD_MIN", "RAIO_IDEAL", "RAIO_MAX", "RAIO_STEP"]
 DROP_AUX_COLUMNS = ["TS", "_ROW_KEY", "NOME", "EMAIL", "BASE", "SERVICO", "PACOTES"]
+_UTF8_BOM = "\ufeff".encode("utf-8")
 
 
 @dataclass
@@ -53,6 +56,42 @@ def _filter_selection(df: pd.DataFrame, *, exclude_unselected: bool, selection_c
     return df
 
 
+def _is_plain_arrow_type(dtype: pa.DataType) -> bool:
+    return (
+        pa.types.is_string(dtype)
+        or pa.types.is_large_string(dtype)
+        or pa.types.is_integer(dtype)
+        or pa.types.is_null(dtype)
+    )
+
+
+def _to_csv_bytes(df: pd.DataFrame, sep: str) -> bytes:
+    """Serialise *df* as UTF-8-with-BOM CSV, matching ``DataFrame.to_csv``.
+
+    Text and integer columns go through Arrow's C++ writer.  Anything whose
+    text would differ (floats, booleans, dates...) or that needs quoting
+    falls back to pandas.  Both paths end lines with ``\\n`` whatever the
+    platform's ``os.linesep``.
+    """
+
+    names = [str(column) for column in df.columns]
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if not all(_is_plain_arrow_type(field.type) for field in table.schema):
+            raise pa.ArrowInvalid("column types need pandas formatting")
+        if any(char in name for name in names for char in (sep, '"', "\n", "\r")):
+            raise pa.ArrowInvalid("header needs quoting")
+        buf = pa.BufferOutputStream()
+        # Unquoted output, as pandas writes it; Arrow raises if a value
+        # would need quotes.
+        options = pacsv.WriteOptions(include_header=False, delimiter=sep, quoting_style="none")
+        pacsv.write_csv(table, buf, write_options=options)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return df.to_csv(index=False, sep=sep, na_rep="", lineterminator="\n").encode("utf-8-sig")
+    header = f"{sep.join(names)}\n".encode("utf-8")
+    return _UTF8_BOM + header + buf.getvalue().to_pybytes()
+
+
 def generate_csv_payloads(
     df: pd.DataFrame,
     *,
@@ -78,13 +117,12 @@ def generate_csv_payloads(
 
         subset = _drop_auxiliary_columns(subset)
         subset = _ensure_numeric_columns(subset)
-        csv_str = subset.to_csv(index=False, sep=sep, encoding="utf-8-sig", na_rep="")
         payloads.append(
             CsvPayload(
                 turma=turma,
                 carteira=carteira,
                 file_name=f"config_{str(turma).lower()}_{_carteira_suffix(str(carteira))}.csv",
-                content=csv_str.encode("utf-8-sig"),
+                content=_to_csv_bytes(subset, sep),
             )
         )
 
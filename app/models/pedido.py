@@ -55,6 +55,29 @@ def build_row_key_from_series(row: pd.Series) -> str:
     )
 
 
+_ROW_KEY_TEXT_COLUMNS = ("TIMESTAMP", "NOME", "E-MAIL", "UTD", "BASE", "SERVICO")
+
+
+def _row_key_part(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    # ``map(str)`` (rather than ``astype(str)``) keeps the exact text produced
+    # by ``str(value)`` for timestamps and missing values.
+    return df[column].map(str).astype(object)
+
+
+def build_row_keys_vectorized(df: pd.DataFrame) -> pd.Series:
+    """Column-wise equivalent of :func:`build_row_key_from_series`."""
+
+    if "PACOTES" in df.columns:
+        pacotes = pd.to_numeric(df["PACOTES"], errors="coerce").fillna(0).astype("int64").map(str).astype(object)
+    else:
+        pacotes = pd.Series("0", index=df.index, dtype=object)
+
+    parts = [_row_key_part(df, column) for column in _ROW_KEY_TEXT_COLUMNS]
+    return parts[0].str.cat([*parts[1:], pacotes], sep="\n")
+
+
 def label_to_status_db(label: str) -> str:
     return STATUS_LABEL_INV.get(label, Status.EM_ANALISE)
 
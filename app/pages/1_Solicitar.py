@@ -1,33 +1,28 @@
 """Página responsável pela criação de novos pedidos."""
 from __future__ import annotations
 
-from typing import Dict, List
+from datetime import datetime
+from typing import Dict, List, Mapping, Tuple
 
-import pandas as pd
 import streamlit as st
 from hdbcli import dbapi
 
 from app.components.dialogs import show_submission_success
-from app.components.editors import request_lines_editor
+from app.components.editors import request_lines_dataframe, request_lines_editor
 from app.components.forms import render_sidebar, requester_identification, validate_requester
 from app.services.hana import HanaConfig
+from app.services.pedidos_cache import clear_pedidos_cache
 from app.services.pedidos_service import insert_pedidos_rows
 from app.services.pedidos_submission import prepare_submission_dataframe
 from app.state import session_keys as keys
-from app.utils.cache import load_dag40_cached
+from app.utils.cache import load_dag40_lookups_cached
 from app.utils.constants import DEFAULT_SERVICOS
-from app.utils.time_windows import current_time_window
-from app.utils.validators import strip_accents_and_punct_name
-
-
-def _base_options(dag40_df: pd.DataFrame, utd: str, turma: str) -> List[str]:
-    subset = dag40_df[(dag40_df["UTD"] == utd) & (dag40_df["TURMA"] == turma)]["BASE"]
-    options = [opt for opt in subset.dropna().unique().tolist() if opt]
-    return sorted(options, key=str.casefold)
+from app.utils.time_windows import TZ, current_time_window
+from app.utils.validators import normalize_email, strip_accents_and_punct_name
 
 
 def _render_base_selection(
-    dag40_df: pd.DataFrame,
+    bases_by_utd_turma: Mapping[Tuple[str, str], List[str]],
     *,
     utds_sel: List[str],
     turma_sel: str | None,
@@ -44,7 +39,7 @@ def _render_base_selection(
         st.session_state[keys.UTD_BASE_SELECTION] = {}
         return {}
 
-    base_options_by_utd = {utd: _base_options(dag40_df, utd, turma_sel) for utd in utds_sel}
+    base_options_by_utd = {utd: bases_by_utd_turma.get((utd, turma_sel), []) for utd in utds_sel}
 
     for i, utd in enumerate(utds_sel):
         with cols[i % 2]:
@@ -69,17 +64,17 @@ def _render_base_selection(
 def main() -> None:
     render_sidebar(show_instructions=True)
 
-    window = current_time_window()
-    dag40_df = load_dag40_cached()
+    now = datetime.now(TZ)
+    window = current_time_window(now)
+    dag40_lookups = load_dag40_lookups_cached()
 
     servicos_opcoes = DEFAULT_SERVICOS
 
     nome_input, email_input = requester_identification()
 
-    utd_options = sorted([u for u in dag40_df["UTD"].dropna().unique().tolist() if u], key=str.casefold)
     utds_sel = st.multiselect(
         "UTDs*",
-        options=utd_options,
+        options=dag40_lookups.utd_options,
         placeholder="Escolha uma ou mais UTDs",
         key=keys.UTD_SELECTION,
     )
@@ -91,10 +86,10 @@ def main() -> None:
         key=keys.TURMA_SELECTION,
     )
 
-    _render_base_selection(dag40_df, utds_sel=utds_sel, turma_sel=turma_sel)
+    _render_base_selection(dag40_lookups.bases_by_utd_turma, utds_sel=utds_sel, turma_sel=turma_sel)
 
     request_lines_editor(
-        dag40_df,
+        dag40_lookups.zona_by_key,
         utds_sel=utds_sel,
         turma_sel=turma_sel,
         geracao_options=window.available_options,
@@ -105,9 +100,10 @@ def main() -> None:
     st.divider()
     col_send, col_clear = st.columns([1, 1])
 
-    can_send = bool(strip_accents_and_punct_name(nome_input)) and bool(email_input.strip())
-    lines_df = st.session_state.get(keys.REQUEST_LINES, pd.DataFrame())
-    can_send = can_send and not lines_df.empty
+    # Cheap per-rerun gate: the lines DataFrame is only built on submit.
+    nome_norm = strip_accents_and_punct_name(nome_input)
+    has_lines = bool(st.session_state.get(keys.REQUEST_ROWS))
+    can_send = bool(nome_norm) and bool(email_input.strip()) and has_lines
 
     if col_send.button(
         "📨 Enviar Solicitação",
@@ -117,12 +113,14 @@ def main() -> None:
     ):
         try:
             validate_requester(nome_input, email_input)
+            lines_df = request_lines_dataframe()
             out_df = prepare_submission_dataframe(
                 lines_df,
                 nome=nome_input,
                 email=email_input,
                 turma=turma_sel or "",
                 after_1055=window.after_1055,
+                timestamp=now,
             )
             cfg = HanaConfig.from_env()
             inserted = insert_pedidos_rows(out_df, connector=dbapi.connect, config=cfg)
@@ -136,15 +134,14 @@ def main() -> None:
                 "JUSTIFICATIVA",
                 "COMENTARIO",
             ]
-            resumo_df = lines_df[resumo_cols].copy()
-            resumo_df["PACOTES"] = pd.to_numeric(resumo_df["PACOTES"], errors="coerce").fillna(0).astype(int)
+            resumo_df = lines_df[resumo_cols]
 
             st.session_state[keys.SUCCESS_QUANTITY] = inserted
-            st.session_state[keys.SUCCESS_NAME] = strip_accents_and_punct_name(nome_input)
-            st.session_state[keys.SUCCESS_EMAIL] = email_input.strip().lower()
+            st.session_state[keys.SUCCESS_NAME] = nome_norm
+            st.session_state[keys.SUCCESS_EMAIL] = normalize_email(email_input)
             st.session_state[keys.SUCCESS_RESUMO] = resumo_df
 
-            st.cache_data.clear()
+            clear_pedidos_cache()
             show_submission_success()
         except Exception as exc:  # noqa: BLE001 - show message to user
             st.error(f"Falha ao enviar: {exc}")
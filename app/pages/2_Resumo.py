@@ -3,15 +3,47 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from app.components.forms import render_sidebar
+from app.services.pedidos_service import build_filter_options
 from app.state import session_keys as keys
-from app.utils.cache import fetch_pedidos_cached
+from app.utils.cache import fetch_pedidos_with_dates_cached
 from app.utils.time_windows import TZ
 
 
+_SHOW_COLUMNS = [
+    "DATA_HORA",
+    "NOME",
+    "E-MAIL",
+    "UTD",
+    "BASE",
+    "TURMA",
+    "SERVICO",
+    "PACOTES",
+    "CADEIA",
+    "JUSTIFICATIVA",
+    "COMENTARIOS",
+    "STATUS_LABEL",
+]
+_PRETTY_NAMES = {
+    "DATA_HORA": "Data e hora",
+    "NOME": "Nome",
+    "E-MAIL": "E-mail",
+    "UTD": "UTD",
+    "BASE": "BASE",
+    "TURMA": "TURMA",
+    "SERVICO": "Serviço",
+    "PACOTES": "Pacotes",
+    "CADEIA": "Geração para",
+    "JUSTIFICATIVA": "Justificativa",
+    "COMENTARIOS": "Comentário",
+    "STATUS_LABEL": "Status",
+}
+
+
 def _reset_filters() -> None:
     for key in [
         keys.RESUMO_DATE_FILTER,
@@ -24,32 +56,33 @@ def _reset_filters() -> None:
 
 
 def _apply_filters(df: pd.DataFrame) -> pd.DataFrame:
-    result = df.copy()
+    # Every filter narrows one boolean mask; the frame is sliced once, onto
+    # the displayed columns only, so st.dataframe serialises nothing else.
+    mask = np.ones(len(df), dtype=bool)
 
     try:
         selected_date = st.session_state.get(keys.RESUMO_DATE_FILTER)
         if isinstance(selected_date, datetime):
-            result = result[result["TS_DT"].dt.date == selected_date.date()]
-        elif hasattr(selected_date, "year"):
-            result = result[result["TS_DT"].dt.date == selected_date]
+            selected_date = selected_date.date()
+        if hasattr(selected_date, "year"):
+            mask &= df["TS_DAY"].to_numpy() == np.datetime64(selected_date, "D")
     except Exception:
         pass
 
     utd_filter = st.session_state.get(keys.RESUMO_UTD_FILTER) or []
     if utd_filter:
-        result = result[result["UTD"].isin(utd_filter)]
+        mask &= df["UTD"].isin(utd_filter).to_numpy()
 
     base_filter = st.session_state.get(keys.RESUMO_BASE_FILTER) or []
     if base_filter:
-        result = result[result["BASE"].isin(base_filter)]
+        mask &= df["BASE"].isin(base_filter).to_numpy()
 
     email_contains = (st.session_state.get(keys.RESUMO_EMAIL_FILTER) or "").strip().lower()
     if email_contains:
-        result = result[
-            result["E-MAIL"].astype(str).str.lower().str.contains(email_contains, na=False)
-        ]
+        mask &= df["_EMAIL_LC"].str.contains(email_contains, regex=False).to_numpy()
 
-    return result
+    show_cols = [col for col in _SHOW_COLUMNS if col in df.columns]
+    return df.loc[mask, show_cols].reset_index(drop=True)
 
 
 def main() -> None:
@@ -58,17 +91,15 @@ def main() -> None:
     st.subheader("Resumo de Pedidos", divider=True)
 
     try:
-        resumo_df = fetch_pedidos_cached()
+        resumo_df = fetch_pedidos_with_dates_cached()
     except Exception as exc:  # noqa: BLE001 - show message to user
         st.error(f"Erro ao carregar pedidos: {exc}")
         st.stop()
 
-    resumo_df["TS_DT"] = pd.to_datetime(resumo_df["TIMESTAMP"], errors="coerce")
-    resumo_df["DATA_HORA"] = resumo_df["TS_DT"].dt.strftime("%d/%m/%Y %H:%M")
-
     if st.session_state.get(keys.RESUMO_RESET, False):
         _reset_filters()
 
+    filter_options = build_filter_options(resumo_df)
     with st.expander("Filtros", expanded=True):
         col_dt, col_utd, col_base = st.columns([1.6, 1.6, 2.3])
         with col_dt:
@@ -80,11 +111,9 @@ def main() -> None:
                 key=keys.RESUMO_DATE_FILTER,
             )
         with col_utd:
-            utd_opts = sorted([u for u in resumo_df["UTD"].dropna().unique().tolist() if u], key=str.casefold)
-            st.multiselect("UTD", options=utd_opts, key=keys.RESUMO_UTD_FILTER)
+            st.multiselect("UTD", options=filter_options.utd, key=keys.RESUMO_UTD_FILTER)
         with col_base:
-            base_opts = sorted([b for b in resumo_df["BASE"].dropna().unique().tolist() if b], key=str.casefold)
-            st.multiselect("BASE", options=base_opts, key=keys.RESUMO_BASE_FILTER)
+            st.multiselect("BASE", options=filter_options.base, key=keys.RESUMO_BASE_FILTER)
 
         col_email = st.columns([1.6])[0]
         with col_email:
@@ -99,39 +128,8 @@ def main() -> None:
                 st.session_state[keys.RESUMO_RESET] = True
                 st.rerun()
 
-    filtered = _apply_filters(resumo_df)
-    filtered = filtered.sort_values("TS_DT", ascending=True)
-
-    show_cols = [
-        "DATA_HORA",
-        "NOME",
-        "E-MAIL",
-        "UTD",
-        "BASE",
-        "TURMA",
-        "SERVICO",
-        "PACOTES",
-        "CADEIA",
-        "JUSTIFICATIVA",
-        "COMENTARIOS",
-        "STATUS_LABEL",
-    ]
-    pretty_names = {
-        "DATA_HORA": "Data e hora",
-        "NOME": "Nome",
-        "E-MAIL": "E-mail",
-        "UTD": "UTD",
-        "BASE": "BASE",
-        "TURMA": "TURMA",
-        "SERVICO": "Serviço",
-        "PACOTES": "Pacotes",
-        "CADEIA": "Geração para",
-        "JUSTIFICATIVA": "Justificativa",
-        "COMENTARIOS": "Comentário",
-    }
-
-    filtered = filtered.rename(columns=pretty_names)
-    filtered = filtered[[pretty_names[col] for col in show_cols if col in filtered.columns]]
+    # Rows arrive sorted by TIMESTAMP and the filters keep that order.
+    filtered = _apply_filters(resumo_df).rename(columns=_PRETTY_NAMES)
 
     if filtered.empty:
         st.info("Nenhum registro encontrado para os filtros selecionados.")
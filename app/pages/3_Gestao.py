@@ -4,30 +4,28 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Iterable, List
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 from hdbcli import dbapi
 
 from app.components.forms import render_sidebar
 from app.exporters.csv_exporter import generate_csv_payloads
-from app.models.pedido import build_row_key_from_series
+from app.models.pedido import build_row_keys_vectorized
 from app.services.auth_service import authenticator_from_config, load_auth_config
-from app.services.hana import HanaConfig, create_connection
-from app.services.pedidos_service import apply_status_changes, pedidos_table_has_column
+from app.services.hana import HanaConfig
+from app.services.pedidos_cache import (
+    clear_pedidos_cache,
+    fetch_filtered_pedidos_cached,
+    fetch_pedidos_admin_view,
+    fetch_pedidos_filter_options_cached,
+)
+from app.services.pedidos_service import PedidosFilter, apply_status_changes, pedidos_table_columns
 from app.state import session_keys as keys
-from app.utils.cache import fetch_pedidos_cached
+from app.utils.cache import fetch_cluster_config_cached
 from app.utils.constants import ALLOWED_ADMINS, STATUS_LABEL_INV, STATUS_LABEL_MAP
 from app.utils.time_windows import TZ
-
-
-def _load_admin_df() -> pd.DataFrame:
-    df = fetch_pedidos_cached()
-    status_norm = df["STATUS"].fillna("").astype(str).str.upper().str.strip()
-    df["STATUS_NORM"] = status_norm.where(~status_norm.isin(["", "NAN", "NONE", "NULL"]), "EM ANALISE")
-    df["TS_DT"] = pd.to_datetime(df["TIMESTAMP"], errors="coerce")
-    df["DATA_HORA"] = df["TS_DT"].dt.strftime("%d/%m/%Y %H:%M")
-    df["_ROW_KEY"] = df.apply(build_row_key_from_series, axis=1)
-    return df
+from app.utils.validators import normalize_email
 
 
 def _reset_admin_filters() -> None:
@@ -42,40 +40,46 @@ def _reset_admin_filters() -> None:
     st.session_state[keys.ADMIN_RESET] = False
 
 
-def _apply_admin_filters(df: pd.DataFrame) -> pd.DataFrame:
-    result = df.copy()
+_EDITOR_COLUMNS = [
+    "DATA_HORA",
+    "NOME",
+    "E-MAIL",
+    "UTD",
+    "BASE",
+    "TURMA",
+    "SERVICO",
+    "PACOTES",
+    "CADEIA",
+    "JUSTIFICATIVA",
+    "COMENTARIOS",
+]
+
+
+def _admin_filters() -> PedidosFilter:
+    # Evaluated by HANA (see fetch_filtered_pedidos_cached), not in pandas.
+    day = None
     try:
         selected_date = st.session_state.get(keys.ADMIN_DATE_FILTER)
         if isinstance(selected_date, datetime):
-            result = result[result["TS_DT"].dt.date == selected_date.date()]
+            day = selected_date.date()
         elif hasattr(selected_date, "year"):
-            result = result[result["TS_DT"].dt.date == selected_date]
+            day = selected_date
     except Exception:
         pass
 
-    utd_filter = st.session_state.get(keys.ADMIN_UTD_FILTER) or []
-    if utd_filter:
-        result = result[result["UTD"].isin(utd_filter)]
-
-    base_filter = st.session_state.get(keys.ADMIN_BASE_FILTER) or []
-    if base_filter:
-        result = result[result["BASE"].isin(base_filter)]
-
-    email_contains = (st.session_state.get(keys.ADMIN_EMAIL_FILTER) or "").strip().lower()
-    if email_contains:
-        result = result[result["E-MAIL"].astype(str).str.lower().str.contains(email_contains, na=False)]
-
     status_filter = st.session_state.get(keys.ADMIN_STATUS_FILTER) or []
-    if status_filter:
-        db_values = [STATUS_LABEL_INV.get(label, "EM ANALISE") for label in status_filter]
-        result = result[result["STATUS_NORM"].isin(db_values)]
-
-    return result
+    return PedidosFilter(
+        day=day,
+        utds=tuple(st.session_state.get(keys.ADMIN_UTD_FILTER) or ()),
+        bases=tuple(st.session_state.get(keys.ADMIN_BASE_FILTER) or ()),
+        statuses=tuple(STATUS_LABEL_INV.get(label, "EM ANALISE") for label in status_filter),
+        email_contains=(st.session_state.get(keys.ADMIN_EMAIL_FILTER) or "").strip().lower(),
+    )
 
 
 def _ensure_admin_state() -> None:
     st.session_state.setdefault(keys.ADMIN_PENDING_CHANGES, {})
-    st.session_state.setdefault(keys.ADMIN_INDEX_TO_KEY, {})
+    st.session_state.setdefault(keys.ADMIN_ROW_KEYS, np.empty(0, dtype=object))
     st.session_state.setdefault(keys.CSV_SELECTION, {})
 
 
@@ -85,8 +89,10 @@ def _capture_admin_edits(editor_key: str) -> None:
         return
 
     edited = ed_state.get("edited_rows", {})
+    # Editor positions index straight into the row keys of the rendered grid.
+    row_keys = st.session_state[keys.ADMIN_ROW_KEYS]
     for idx, changes in edited.items():
-        key = st.session_state[keys.ADMIN_INDEX_TO_KEY].get(idx)
+        key = row_keys[idx] if 0 <= idx < len(row_keys) else None
         if not key:
             continue
         if "STATUS" in changes:
@@ -95,41 +101,50 @@ def _capture_admin_edits(editor_key: str) -> None:
             st.session_state[keys.CSV_SELECTION][key] = bool(changes["SELECIONAR"])
 
 
-def _apply_pending_changes(df: pd.DataFrame, admin_email: str) -> int:
-    if not st.session_state[keys.ADMIN_PENDING_CHANGES]:
+def _apply_pending_changes(filtered_df: pd.DataFrame, admin_email: str) -> int:
+    pending = st.session_state[keys.ADMIN_PENDING_CHANGES]
+    if not pending:
         return 0
 
+    admin_df = filtered_df
+    if not set(pending).issubset(filtered_df["_ROW_KEY"].tolist()):
+        # Some edits were made under other filters; resolve them in the full table.
+        admin_df = fetch_pedidos_admin_view()
+
     cfg = HanaConfig.from_env()
-    has_status = pedidos_table_has_column("STATUS", connector=dbapi.connect, config=cfg)
+    # One cached catalog lookup answers both column checks.
+    columns = pedidos_table_columns(connector=dbapi.connect, config=cfg)
+    has_status = "STATUS" in columns
+    has_validado_por = "VALIDADO_POR" in columns
+
     if not has_status:
         st.warning("Coluna STATUS não existe no HANA. Crie a coluna para persistir as alterações.")
         return 0
 
-    has_validado_por = pedidos_table_has_column("VALIDADO_POR", connector=dbapi.connect, config=cfg)
     try:
+        # The frame on screen already carries every row key; no refetch.
         updated = apply_status_changes(
-            df,
-            st.session_state[keys.ADMIN_PENDING_CHANGES],
+            admin_df,
+            pending,
             admin_email=admin_email,
             has_validado_por=has_validado_por,
             connector=dbapi.connect,
             config=cfg,
+            row_keys=admin_df["_ROW_KEY"],
         )
     finally:
-        st.cache_data.clear()
+        clear_pedidos_cache()
 
-    st.session_state[keys.ADMIN_PENDING_CHANGES].clear()
-    if keys.ADMIN_EDITOR_KEY in st.session_state:
-        del st.session_state[keys.ADMIN_EDITOR_KEY]
+    pending.clear()
+    st.session_state.pop(keys.ADMIN_EDITOR_KEY, None)
     return updated
 
 
 def _toggle_selection(filtered_df: pd.DataFrame) -> None:
-    for rk in filtered_df["_ROW_KEY"]:
-        current = bool(st.session_state[keys.CSV_SELECTION].get(rk, True))
-        st.session_state[keys.CSV_SELECTION][rk] = not current
-    if keys.ADMIN_EDITOR_KEY in st.session_state:
-        del st.session_state[keys.ADMIN_EDITOR_KEY]
+    # Fetch the dict once and update it in bulk instead of per-row proxy writes.
+    selection = st.session_state[keys.CSV_SELECTION]
+    selection.update({rk: not selection.get(rk, True) for rk in filtered_df["_ROW_KEY"].tolist()})
+    st.session_state.pop(keys.ADMIN_EDITOR_KEY, None)
 
 
 def _run_cluster_config_query(
@@ -139,111 +154,7 @@ def _run_cluster_config_query(
 ) -> pd.DataFrame:
     turmas = [t.strip().upper() for t in turmas]
     carteiras_db = [c.strip().upper() for c in carteiras_db]
-    turma_placeholders = ",".join(["?"] * len(turmas))
-    cart_placeholders = ",".join(["?"] * len(carteiras_db))
-
-    sql = f"""
-WITH BASES AS (
-  SELECT UTD40, ID_BASE_STC, MIN(BASE_STC) AS BASE_STC, NULL AS ID_BASE_EPS, NULL AS BASE_EPS
-  FROM CLB142840.DAG40
-  GROUP BY UTD40, ID_BASE_STC
-  UNION ALL
-  SELECT UTD40, NULL, NULL, ID_BASE_EPS, MIN(BASE_EPS)
-  FROM CLB142840.DAG40
-  GROUP BY UTD40, ID_BASE_EPS
-),
-CLUSTER_CONFIG AS (
-  SELECT
-    CASE WHEN UTD = 'ITAPUAN' THEN 'ITAPOAN' ELSE TRIM(UPPER(UTD)) END AS UTD,
-    TRIM(UPPER(CARTEIRA)) AS CARTEIRA,
-    TURMA, ZONA,
-    QTD_MIN, QTD_MAX,
-    RAIO_MIN * 1000 AS RAIO_MIN,
-    RAIO_MAX * 1000 AS RAIO_MAX,
-    RAIO_INC * 1000 AS RAIO_INC
-  FROM CLB142840.CLUSTER_CONFIG5
-),
-INNER_Q AS (
-  SELECT
-    BP.UTD,
-    'SIM' AS SELECIONAR,
-    BP.ZONA,
-    '' AS LOCALI,
-    '' AS MUNICIPIO,
-    '' AS BAIRRO,
-    '' AS TIPO_LOCAL,
-    BP.PACOTES AS CLUSTERS,
-    BP.PACOTES AS PACOTES,
-    COALESCE(CNF.QTD_MAX, '15') AS QTD_MAX,
-    COALESCE(CNF.QTD_MIN, '10') AS QTD_MIN,
-    COALESCE(CNF.RAIO_MIN, '4000') AS RAIO_IDEAL,
-    COALESCE(CNF.RAIO_MAX, '5000') AS RAIO_MAX,
-    COALESCE(CNF.RAIO_INC, '500') AS RAIO_STEP,
-    CASE
-      WHEN UPPER(BP.SERVICO) LIKE '%GAVIAO%' THEN 'DISJUNTOR'
-      WHEN UPPER(BP.SERVICO) LIKE '%RECORTE%' THEN 'RECORTE'
-      WHEN UPPER(BP.SERVICO) LIKE '%BAIXA%' THEN 'BAIXA'
-      WHEN UPPER(BP.SERVICO) LIKE '%VISITA%' THEN 'COB.DOM'
-      ELSE 'CONVENCIONAL'
-    END AS CARTEIRA,
-    CASE
-      WHEN S.ID_BASE_STC IS NOT NULL AND E.ID_BASE_EPS IS NULL THEN 'STC'
-      WHEN E.ID_BASE_EPS IS NOT NULL AND S.ID_BASE_STC IS NULL THEN 'EPS'
-      WHEN S.ID_BASE_STC IS NOT NULL AND E.ID_BASE_EPS IS NOT NULL THEN 'AMBIGUO'
-      ELSE NULL
-    END AS TURMA,
-    '1' AS PESO_MTVCOB,
-    '2' AS PESO_PECLD,
-    '0' AS PESO_QTDFTVE,
-    '' AS PREENCHER,
-    '' AS QTD_PREENCHER,
-    BP."NOME" AS NOME,
-    BP."E-MAIL" AS EMAIL,
-    BP.BASE AS BASE,
-    BP.SERVICO AS SERVICO,
-    BP."TIMESTAMP" AS TS
-  FROM "U618488"."BASE_PEDIDOS" BP
-  LEFT JOIN BASES S
-    ON BP.ZONA = S.ID_BASE_STC AND TRIM(UPPER(BP.UTD)) = TRIM(UPPER(S.UTD40))
-  LEFT JOIN BASES E
-    ON BP.ZONA = E.ID_BASE_EPS AND TRIM(UPPER(BP.UTD)) = TRIM(UPPER(E.UTD40))
-  LEFT JOIN CLUSTER_CONFIG CNF
-    ON CNF.UTD = TRIM(UPPER(BP.UTD))
-   AND CNF.TURMA = CASE
-      WHEN S.ID_BASE_STC IS NOT NULL AND E.ID_BASE_EPS IS NULL THEN 'STC'
-      WHEN E.ID_BASE_EPS IS NOT NULL AND S.ID_BASE_STC IS NULL THEN 'EPS'
-      WHEN S.ID_BASE_STC IS NOT NULL AND E.ID_BASE_EPS IS NOT NULL THEN 'AMBIGUO'
-      ELSE NULL
-    END
-   AND (
-      (UPPER(TRIM(COALESCE(BP.SERVICO, ''))) LIKE '%GAVIAO%' AND CNF.CARTEIRA = 'DISJUNTOR')
-      OR (UPPER(TRIM(COALESCE(BP.SERVICO, ''))) NOT LIKE '%GAVIAO%' AND CNF.ZONA = BP.ZONA)
-   )
-  WHERE TO_DATE(BP."TIMESTAMP") = ?
-)
-SELECT *
-FROM INNER_Q
-WHERE TURMA IN ({turma_placeholders})
-  AND CARTEIRA IN ({cart_placeholders})
-ORDER BY TO_DATE(TS) ASC, TO_VARCHAR(TS, 'HH24:MI:SS') ASC
-"""
-
-    params = [sel_date] + list(turmas) + list(carteiras_db)
-    cfg = HanaConfig.from_env()
-    conn = None
-    cur = None
-    try:
-        conn = create_connection(cfg, dbapi.connect)
-        cur = conn.cursor()
-        cur.execute(sql, params)
-        rows = cur.fetchall()
-        cols = [c[0] for c in cur.description]
-        return pd.DataFrame(rows, columns=cols).fillna("")
-    finally:
-        if cur is not None:
-            cur.close()
-        if conn is not None:
-            conn.close()
+    return fetch_cluster_config_cached(sel_date, turmas, carteiras_db)
 
 
 def _store_csv_state(df_all: pd.DataFrame, dt: date, turmas: List[str], carteiras: List[str]) -> None:
@@ -319,22 +230,16 @@ def _render_csv_generation_tools(admin_df: pd.DataFrame) -> None:
                 st.warning("Nenhum dado encontrado para os filtros selecionados.")
                 _store_csv_state(pd.DataFrame(), gen_date, turmas_sel, carteiras_db_sel)
             else:
-                df_all_for_key = pd.DataFrame(
-                    {
-                        "TIMESTAMP": df_all["TS"],
-                        "NOME": df_all["NOME"],
-                        "E-MAIL": df_all["EMAIL"],
-                        "UTD": df_all["UTD"],
-                        "BASE": df_all["BASE"],
-                        "SERVICO": df_all["SERVICO"],
-                        "PACOTES": pd.to_numeric(df_all["PACOTES"], errors="coerce").fillna(0).astype(int),
-                    }
+                # Same key layout as the grid, built column-wise from the
+                # cluster query's own column names.
+                df_all["_ROW_KEY"] = build_row_keys_vectorized(
+                    df_all.rename(columns={"TS": "TIMESTAMP", "EMAIL": "E-MAIL"})
                 )
-                df_all["_ROW_KEY"] = df_all_for_key.apply(build_row_key_from_series, axis=1)
                 sel_map = st.session_state.get(keys.CSV_SELECTION, {})
-                df_all["SELECIONAR"] = df_all["_ROW_KEY"].map(lambda k: "SIM" if sel_map.get(k, True) else "NAO")
+                selected = df_all["_ROW_KEY"].map(sel_map).fillna(True).astype(bool).to_numpy()
+                df_all["SELECIONAR"] = np.where(selected, "SIM", "NAO")
                 if excluir_desmarcados:
-                    df_all = df_all[df_all["SELECIONAR"].str.upper() == "SIM"].copy()
+                    df_all = df_all.loc[selected]
                     if df_all.empty:
                         st.warning("Nenhuma linha marcada para exportação com os filtros atuais.")
                 _store_csv_state(df_all, gen_date, turmas_sel, carteiras_db_sel)
@@ -344,15 +249,11 @@ def _render_csv_generation_tools(admin_df: pd.DataFrame) -> None:
 
     if _state_matches_current(gen_date, turmas_sel, carteiras_db_sel):
         df_all = st.session_state["csv_gen_state"]["df_all"]
-        turmas_presentes = sorted(df_all["TURMA"].dropna().unique().tolist())
-        carteiras_presentes = sorted(df_all["CARTEIRA"].dropna().unique().tolist())
+        # One grouped count instead of a mask per TURMA x CARTEIRA cell.
+        counts = df_all.groupby(["TURMA", "CARTEIRA"]).size().unstack(fill_value=0)
         with st.expander("Prévia de contagem por TURMA x CARTEIRA", expanded=False):
-            for turma in turmas_presentes:
-                row = []
-                for cart in carteiras_presentes:
-                    n = int(((df_all["TURMA"] == turma) & (df_all["CARTEIRA"] == cart)).sum())
-                    row.append(f"{cart}: {n}")
-                st.write(f"**{turma}** → " + " | ".join(row))
+            for turma, row in counts.iterrows():
+                st.write(f"**{turma}** → " + " | ".join(f"{cart}: {int(n)}" for cart, n in row.items()))
 
         payloads = generate_csv_payloads(
             df_all,
@@ -404,7 +305,7 @@ def main() -> None:
         st.info("Faça login para gerenciar os pedidos.")
         st.stop()
 
-    user_email = (st.session_state.get(keys.USERNAME) or "").strip().lower()
+    user_email = normalize_email(st.session_state.get(keys.USERNAME))
     if user_email not in ALLOWED_ADMINS:
         st.error("Usuário sem permissão para acessar a Gestão.")
         authenticator.logout("Sair", "main", key="logout_no_perm")
@@ -421,23 +322,23 @@ def main() -> None:
             with btn_refresh:
                 if st.button("🔄 Atualizar dados", use_container_width=True):
                     st.cache_data.clear()
+                    clear_pedidos_cache()
                     st.rerun()
             with btn_logout:
                 authenticator.logout("Sair", "main", key="logout_admin")
 
     st.divider()
 
-    if keys.ADMIN_LAST_APPLY in st.session_state:
-        upd_count = st.session_state.pop(keys.ADMIN_LAST_APPLY, None)
-        if upd_count is not None:
-            st.success(f"✅ Mudanças aplicadas no HANA com sucesso ({upd_count} linha(s) atualizada(s)).")
-            st.session_state.setdefault("show_csv_tools", True)
+    upd_count = st.session_state.pop(keys.ADMIN_LAST_APPLY, None)
+    if upd_count is not None:
+        st.success(f"✅ Mudanças aplicadas no HANA com sucesso ({upd_count} linha(s) atualizada(s)).")
+        st.session_state.setdefault("show_csv_tools", True)
 
     _ensure_admin_state()
 
     with st.expander("Filtros", expanded=True):
         try:
-            admin_df = _load_admin_df()
+            filter_options = fetch_pedidos_filter_options_cached()
         except Exception as exc:  # noqa: BLE001 - show message to user
             st.error(f"Erro ao carregar pedidos: {exc}")
             st.stop()
@@ -447,19 +348,16 @@ def main() -> None:
 
         row1c1, row1c2, row1c3, row1c4 = st.columns([1.4, 1.4, 2.2, 1.0])
         with row1c1:
-            ts_valid = admin_df["TS_DT"].dropna()
-            default_date = ts_valid.max().date() if not ts_valid.empty else datetime.now(TZ).date()
+            default_date = filter_options.latest_day or datetime.now(TZ).date()
             st.date_input(
                 "Data do pedido",
                 value=st.session_state.get(keys.ADMIN_DATE_FILTER, default_date),
                 key=keys.ADMIN_DATE_FILTER,
             )
         with row1c2:
-            utd_opts = sorted([u for u in admin_df["UTD"].dropna().unique().tolist() if u], key=str.casefold)
-            st.multiselect("UTD", options=utd_opts, key=keys.ADMIN_UTD_FILTER)
+            st.multiselect("UTD", options=filter_options.utd, key=keys.ADMIN_UTD_FILTER)
         with row1c3:
-            base_opts = sorted([b for b in admin_df["BASE"].dropna().unique().tolist() if b], key=str.casefold)
-            st.multiselect("BASE", options=base_opts, key=keys.ADMIN_BASE_FILTER)
+            st.multiselect("BASE", options=filter_options.base, key=keys.ADMIN_BASE_FILTER)
         with row1c4:
             status_opts = list(STATUS_LABEL_MAP.values())
             st.multiselect("Status", options=status_opts, key=keys.ADMIN_STATUS_FILTER)
@@ -478,47 +376,32 @@ def main() -> None:
                 st.session_state[keys.ADMIN_RESET] = True
                 st.rerun()
 
-    filtered_df = _apply_admin_filters(admin_df)
-    filtered_df = filtered_df.sort_values("TS_DT", ascending=True)
+    try:
+        filtered_df = fetch_filtered_pedidos_cached(_admin_filters())
+    except Exception as exc:  # noqa: BLE001 - show message to user
+        st.error(f"Erro ao carregar pedidos: {exc}")
+        st.stop()
+    # Already sorted by TIMESTAMP in normalize_pedidos_for_ui.
 
     total_filtrados = len(filtered_df)
     st.caption(f"{total_filtrados} linha(s) após filtro.")
 
     sel_map = st.session_state[keys.CSV_SELECTION]
-    st.session_state[keys.ADMIN_INDEX_TO_KEY] = {idx: rk for idx, rk in enumerate(filtered_df["_ROW_KEY"].tolist())}
-
-    editor_df = filtered_df.copy()
-
-    def _label_from_db_or_pending(idx: int, db_value_norm: str) -> str:
-        key = st.session_state[keys.ADMIN_INDEX_TO_KEY].get(idx)
-        if key and key in st.session_state[keys.ADMIN_PENDING_CHANGES]:
-            return st.session_state[keys.ADMIN_PENDING_CHANGES][key]
-        return STATUS_LABEL_MAP.get(str(db_value_norm).upper().strip(), "🟡 Pendente")
-
-    editor_df["STATUS"] = [
-        _label_from_db_or_pending(i, v) for i, v in enumerate(filtered_df["STATUS_NORM"].tolist())
-    ]
-    editor_df["DATA_HORA"] = filtered_df["DATA_HORA"]
-    editor_df["SELECIONAR"] = [bool(sel_map.get(rk, True)) for rk in filtered_df["_ROW_KEY"]]
-
-    cols_show = [
-        "DATA_HORA",
-        "NOME",
-        "E-MAIL",
-        "UTD",
-        "BASE",
-        "TURMA",
-        "SERVICO",
-        "PACOTES",
-        "CADEIA",
-        "JUSTIFICATIVA",
-        "COMENTARIOS",
-        "STATUS",
-        "SELECIONAR",
-    ]
+    st.session_state[keys.ADMIN_ROW_KEYS] = filtered_df["_ROW_KEY"].to_numpy(dtype=object)
+
+    # Pending edits win over the stored label (STATUS_LABEL, built at fetch).
+    pending_labels = filtered_df["_ROW_KEY"].map(st.session_state[keys.ADMIN_PENDING_CHANGES])
+    status_labels = pending_labels.fillna(filtered_df["STATUS_LABEL"])
+    # Only the displayed columns reach the editor; text columns are already
+    # Arrow strings and STATUS is a small categorical.
+    editor_df = filtered_df[_EDITOR_COLUMNS].assign(
+        STATUS=pd.Categorical(status_labels, categories=list(STATUS_LABEL_MAP.values())),
+        # Rows never toggled default to selected.
+        SELECIONAR=filtered_df["_ROW_KEY"].map(sel_map).fillna(True).astype(bool),
+    )
 
     st.data_editor(
-        editor_df[cols_show],
+        editor_df,
         key=keys.ADMIN_EDITOR_KEY,
         on_change=lambda: _capture_admin_edits(keys.ADMIN_EDITOR_KEY),
         hide_index=True,
@@ -555,10 +438,10 @@ def main() -> None:
     with act2:
         approve_all_disabled = filtered_df.empty
         if st.button("🟢 Aprovar tudo", use_container_width=True, disabled=approve_all_disabled):
-            for rk in filtered_df["_ROW_KEY"].tolist():
-                st.session_state[keys.ADMIN_PENDING_CHANGES][rk] = "🟢 Aprovado"
-            if keys.ADMIN_EDITOR_KEY in st.session_state:
-                del st.session_state[keys.ADMIN_EDITOR_KEY]
+            st.session_state[keys.ADMIN_PENDING_CHANGES].update(
+                dict.fromkeys(filtered_df["_ROW_KEY"].tolist(), "🟢 Aprovado")
+            )
+            st.session_state.pop(keys.ADMIN_EDITOR_KEY, None)
             st.rerun()
     with act3:
         if st.button(
@@ -568,8 +451,7 @@ def main() -> None:
             disabled=(pending_count == 0),
         ):
             try:
-                current_df = _load_admin_df()
-                updated = _apply_pending_changes(current_df, st.session_state.get(keys.ADMIN_EMAIL, ""))
+                updated = _apply_pending_changes(filtered_df, st.session_state.get(keys.ADMIN_EMAIL, ""))
                 st.session_state[keys.ADMIN_LAST_APPLY] = updated
                 st.session_state["show_csv_tools"] = True
                 st.rerun()
@@ -582,8 +464,7 @@ def main() -> None:
             disabled=(pending_count == 0),
         ):
             st.session_state[keys.ADMIN_PENDING_CHANGES].clear()
-            if keys.ADMIN_EDITOR_KEY in st.session_state:
-                del st.session_state[keys.ADMIN_EDITOR_KEY]
+            st.session_state.pop(keys.ADMIN_EDITOR_KEY, None)
             st.info("Alterações pendentes descartadas.")
             st.rerun()
 
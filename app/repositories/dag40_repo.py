@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import pandas as pd
 
-from app.services.hana import HanaConfig, SupportsHanaConnect, create_connection
+from app.services.hana import HanaConfig, SupportsHanaConnect, pooled_connection
+
+DAG40_STRING_DTYPES = {"UTD": "string", "BASE": "string", "ZONA": "string", "TURMA": "string"}
 
 SQL_DAG40 = """
 SELECT
@@ -38,19 +40,14 @@ def fetch_dag40(connector: SupportsHanaConnect, config: HanaConfig | None = None
     """Fetch the DAG40 table from HANA as a ``pandas`` dataframe."""
 
     cfg = config or HanaConfig.from_env()
-    conn = None
-    cur = None
-    try:
-        conn = create_connection(cfg, connector)
+    with pooled_connection(cfg, connector) as conn:
         cur = conn.cursor()
-        cur.execute(SQL_DAG40)
-        rows = cur.fetchall()
-        cols = [col[0] for col in cur.description]
-    finally:
-        if cur is not None:
+        try:
+            cur.execute(SQL_DAG40)
+            rows = cur.fetchall()
+            cols = [col[0] for col in cur.description]
+        finally:
             cur.close()
-        if conn is not None:
-            conn.close()
 
     frame = pd.DataFrame(rows, columns=cols).fillna("")
-    return frame.astype({"UTD": "string", "BASE": "string", "ZONA": "string", "TURMA": "string"})
+    return frame.astype(DAG40_STRING_DTYPES)
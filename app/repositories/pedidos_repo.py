@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Sequence
+from datetime import date
+from functools import lru_cache
+from typing import List, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
-from app.models.pedido import build_row_key_from_series
-from app.services.hana import HanaConfig, SupportsHanaConnect, create_connection
-from app.utils.constants import PEDIDOS_TABLE, STATUS_LABEL_INV, Status
+from app.models.pedido import build_row_keys_vectorized
+from app.services.hana import HanaConfig, SupportsHanaConnect, pooled_connection
+from app.utils.constants import PEDIDOS_TABLE, STATUS_DB_VALUES, STATUS_LABEL_INV, Status
 
 
 @dataclass
@@ -23,61 +26,308 @@ class StatusChange:
     status: str
     validado_por: str | None = None
 
-    def as_tuple(self) -> tuple:
-        base = (
-            self.status,
-            self.timestamp,
-            self.nome,
-            self.email,
-            self.utd,
-            self.base,
-            self.servico,
-            int(self.pacotes),
-        )
-        if self.validado_por is None:
-            return base
-        return (
-            self.status,
-            self.validado_por,
-            self.timestamp,
-            self.nome,
-            self.email,
-            self.utd,
-            self.base,
-            self.servico,
-            int(self.pacotes),
-        )
+
+def as_param_rows(changes: Sequence[StatusChange], has_validado_por: bool) -> List[tuple]:
+    """Return the ``executemany`` parameter rows for *changes*.
+
+    The columns are gathered one attribute at a time and zipped once, which
+    matches the placeholder order of the UPDATE built by
+    :func:`update_statuses`.
+    """
+
+    status = [c.status for c in changes]
+    timestamp = [c.timestamp for c in changes]
+    nome = [c.nome for c in changes]
+    email = [c.email for c in changes]
+    utd = [c.utd for c in changes]
+    base = [c.base for c in changes]
+    servico = [c.servico for c in changes]
+    pacotes = [int(c.pacotes) for c in changes]
+    if has_validado_por:
+        validado_por = [c.validado_por for c in changes]
+        return list(zip(status, validado_por, timestamp, nome, email, utd, base, servico, pacotes))
+    return list(zip(status, timestamp, nome, email, utd, base, servico, pacotes))
+
+
+# Columns cleaned up by HANA on read so the dataframe arrives normalised.
+_PEDIDOS_SELECT_OVERRIDES = {
+    "PACOTES": 'TO_INTEGER(COALESCE("PACOTES", 0)) AS "PACOTES"',
+    "STATUS": f"UPPER(TRIM(COALESCE(\"STATUS\", '{Status.EM_ANALISE}'))) AS \"STATUS\"",
+}
+
+PEDIDOS_SELECT_COLUMNS = (
+    "TIMESTAMP",
+    "NOME",
+    "E-MAIL",
+    "CADEIA",
+    "UTD",
+    "BASE",
+    "ZONA",
+    "SERVICO",
+    "PACOTES",
+    "JUSTIFICATIVA",
+    "COMENTARIOS",
+    "STATUS",
+    "TURMA",
+    "VALIDADO_POR",
+)
+
+SQL_TABLE_COLUMNS = "SELECT COLUMN_NAME FROM SYS.TABLE_COLUMNS WHERE SCHEMA_NAME = ? AND TABLE_NAME = ?"
+
+
+@lru_cache(maxsize=8)
+def _query_catalog(
+    schema: str,
+    table: str,
+    connector: SupportsHanaConnect,
+    config: HanaConfig | None,
+) -> frozenset[str]:
+    cfg = config or HanaConfig.from_env()
+
+    with pooled_connection(cfg, connector) as conn:
+        cur = conn.cursor()
+        try:
+            cur.execute(SQL_TABLE_COLUMNS, (schema, table))
+            rows = cur.fetchall()
+        finally:
+            cur.close()
+
+    if not rows:
+        # Raising keeps the empty answer out of the cache.
+        raise RuntimeError(f"Tabela {schema}.{table} não encontrada no catálogo do HANA.")
+    return frozenset(str(row[0]).upper() for row in rows)
+
+
+def fetch_pedidos_columns(
+    connector: SupportsHanaConnect,
+    config: HanaConfig | None = None,
+) -> frozenset[str]:
+    """Return the column names of the pedidos table.
+
+    The names come from a single ``SYS.TABLE_COLUMNS`` lookup that is cached
+    until :func:`clear_pedidos_columns_cache` runs, since the layout only
+    changes through migrations.
+    """
+
+    return _query_catalog(PEDIDOS_TABLE.schema, PEDIDOS_TABLE.table, connector, config)
+
+
+def clear_pedidos_columns_cache() -> None:
+    """Forget the cached column names so newly added columns are picked up."""
+
+    _query_catalog.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _pedidos_select_sql(available: frozenset[str]) -> str:
+    """Build the pedidos SELECT for the columns present in the table.
+
+    Memoised per column set so every refresh sends byte-identical text and
+    hits HANA's SQL plan cache.  There is no ORDER BY: ``TIMESTAMP`` is not
+    indexed, and :func:`normalize_pedidos_for_ui` sorts on the client.
+    """
+
+    select_list = ", ".join(
+        _PEDIDOS_SELECT_OVERRIDES.get(col, f'"{col}"') for col in PEDIDOS_SELECT_COLUMNS if col in available
+    )
+    return f"SELECT {select_list} FROM {PEDIDOS_TABLE.fqn()}"
+
+
+@dataclass(frozen=True)
+class PedidosFilter:
+    """Predicates the Gestão filters push down to HANA.
+
+    Empty values mean "no restriction".  ``statuses`` holds database values
+    (``EM ANALISE``...) and ``email_contains`` a lower-case substring.
+    """
+
+    day: date | None = None
+    utds: Tuple[str, ...] = ()
+    bases: Tuple[str, ...] = ()
+    statuses: Tuple[str, ...] = ()
+    email_contains: str = ""
+
+
+# Mirrors STATUS_NORM: blank or placeholder statuses count as EM ANALISE.
+_STATUS_NORM_SQL = (
+    "CASE WHEN UPPER(TRIM(COALESCE(\"STATUS\", ''))) IN ('', 'NAN', 'NONE', 'NULL') "
+    f"THEN '{Status.EM_ANALISE}' ELSE UPPER(TRIM(\"STATUS\")) END"
+)
+
+
+@lru_cache(maxsize=64)
+def _pedidos_where_sql(
+    has_day: bool,
+    n_utds: int,
+    n_bases: int,
+    n_statuses: int,
+    has_email: bool,
+    has_status_column: bool,
+) -> str:
+    """Build the WHERE clause for a filter shape (same text per shape)."""
+
+    def _in(expr: str, count: int) -> str:
+        return f"{expr} IN ({', '.join(['?'] * count)})"
+
+    clauses = []
+    if has_day:
+        clauses.append('TO_DATE("TIMESTAMP") = ?')
+    if n_utds:
+        clauses.append(_in('"UTD"', n_utds))
+    if n_bases:
+        clauses.append(_in('"BASE"', n_bases))
+    if n_statuses:
+        status_expr = _STATUS_NORM_SQL if has_status_column else f"'{Status.EM_ANALISE}'"
+        clauses.append(_in(status_expr, n_statuses))
+    if has_email:
+        clauses.append("LOWER(\"E-MAIL\") LIKE ? ESCAPE '\\'")
+    return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+
+def _like_contains(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _pedidos_where(filters: PedidosFilter, available: frozenset[str]) -> Tuple[str, list]:
+    sql = _pedidos_where_sql(
+        filters.day is not None,
+        len(filters.utds),
+        len(filters.bases),
+        len(filters.statuses),
+        bool(filters.email_contains),
+        "STATUS" in available,
+    )
+    params: list = []
+    if filters.day is not None:
+        params.append(filters.day)
+    params.extend(filters.utds)
+    params.extend(filters.bases)
+    params.extend(filters.statuses)
+    if filters.email_contains:
+        params.append(_like_contains(filters.email_contains.lower()))
+    return sql, params
 
 
 def fetch_pedidos(
     connector: SupportsHanaConnect,
     config: HanaConfig | None = None,
+    filters: PedidosFilter | None = None,
 ) -> pd.DataFrame:
-    cfg = config or HanaConfig.from_env()
-
-    table = PEDIDOS_TABLE.fqn()
-    sql = f"SELECT * FROM {table} ORDER BY \"TIMESTAMP\" ASC"
+    """Return the pedidos, optionally restricted by *filters* on the server."""
 
-    conn = None
-    cur = None
-    try:
-        conn = create_connection(cfg, connector)
+    cfg = config or HanaConfig.from_env()
+    available = fetch_pedidos_columns(connector, cfg)
+    sql = _pedidos_select_sql(available)
+    params: list = []
+    if filters is not None:
+        where, params = _pedidos_where(filters, available)
+        sql += where
+
+    with pooled_connection(cfg, connector) as conn:
         cur = conn.cursor()
-        cur.execute(sql)
-        rows = cur.fetchall()
-        cols = [col[0] for col in cur.description]
-    finally:
-        if cur is not None:
+        try:
+            if params:
+                cur.execute(sql, params)
+            else:
+                cur.execute(sql)
+            rows = cur.fetchall()
+            cols = [col[0] for col in cur.description]
+        finally:
             cur.close()
-        if conn is not None:
-            conn.close()
 
     df = pd.DataFrame(rows, columns=cols)
-    if "PACOTES" in df.columns:
+    # PACOTES and STATUS are normalised by the SELECT; these guards only kick
+    # in for tables that predate the columns.
+    if "PACOTES" in df.columns and not pd.api.types.is_integer_dtype(df["PACOTES"]):
         df["PACOTES"] = pd.to_numeric(df["PACOTES"], errors="coerce").fillna(0).astype(int)
     if "STATUS" not in df.columns:
         df["STATUS"] = Status.EM_ANALISE
-    return df
+    return _to_arrow_dtypes(df)
+
+
+def _distinct_sql(column: str) -> str:
+    return (
+        f'SELECT DISTINCT "{column}" FROM {PEDIDOS_TABLE.fqn()} '
+        f'WHERE "{column}" IS NOT NULL AND "{column}" <> \'\' ORDER BY UPPER("{column}")'
+    )
+
+
+SQL_DISTINCT_UTD = _distinct_sql("UTD")
+SQL_DISTINCT_BASE = _distinct_sql("BASE")
+SQL_LATEST_DAY = f'SELECT MAX(TO_DATE("TIMESTAMP")) FROM {PEDIDOS_TABLE.fqn()}'
+
+
+def fetch_filter_values(
+    connector: SupportsHanaConnect,
+    config: HanaConfig | None = None,
+) -> Tuple[List[str], List[str], date | None]:
+    """Return the distinct UTDs, the distinct BASEs and the latest pedido day.
+
+    Computed by HANA so the filter widgets do not need the whole table.
+    """
+
+    cfg = config or HanaConfig.from_env()
+
+    with pooled_connection(cfg, connector) as conn:
+        cur = conn.cursor()
+        try:
+            cur.execute(SQL_DISTINCT_UTD)
+            utds = [row[0] for row in cur.fetchall()]
+            cur.execute(SQL_DISTINCT_BASE)
+            bases = [row[0] for row in cur.fetchall()]
+            cur.execute(SQL_LATEST_DAY)
+            latest = cur.fetchall()
+        finally:
+            cur.close()
+
+    latest_day = latest[0][0] if latest else None
+    return utds, bases, latest_day
+
+
+def _to_arrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Store text columns as Arrow strings and ``PACOTES`` as Arrow ``int64``.
+
+    NULL text stays ``<NA>`` so ``dropna()`` keeps skipping it; the derived
+    columns that feed boolean masks fill blanks themselves.
+    """
+
+    dtypes = {col: "string[pyarrow]" for col in df.columns if col not in ("TIMESTAMP", "PACOTES")}
+    if "PACOTES" in df.columns:
+        dtypes["PACOTES"] = "int64[pyarrow]"
+    return df.astype(dtypes)
+
+
+# Small integer codes let the change filter run as a numpy comparison.
+_STATUS_CODES = {status: code for code, status in enumerate(STATUS_DB_VALUES)}
+_UNKNOWN_STATUS_CODE = -1
+
+
+_BLANK_STATUSES = ("", "NAN", "NONE", "NULL")
+
+
+def normalize_status(values: pd.Series) -> pd.Series:
+    """Trim and upper-case raw STATUS values; blanks count as ``EM ANALISE``.
+
+    Missing values and the textual placeholders older rows carry
+    (``NAN``/``NONE``/``NULL``) are folded into the default status.
+    """
+
+    norm = values.astype("string").str.strip().str.upper()
+    return norm.mask(norm.isna() | norm.isin(_BLANK_STATUSES), Status.EM_ANALISE)
+
+
+def _encode_statuses(values: pd.Series) -> np.ndarray:
+    """Encode raw STATUS values as ``int8`` codes (``-1`` when unknown)."""
+
+    return normalize_status(values).map(_STATUS_CODES).fillna(_UNKNOWN_STATUS_CODE).to_numpy(dtype=np.int8)
+
+
+def _filter_changes(idx: np.ndarray, new_codes: np.ndarray, current_codes: np.ndarray) -> np.ndarray:
+    """Return the positions in *idx* whose new status differs from the stored one."""
+
+    return np.flatnonzero(new_codes != current_codes[idx])
+
 
 def build_status_changes(
     df: pd.DataFrame,
@@ -85,54 +335,113 @@ def build_status_changes(
     *,
     admin_email: str | None,
     has_validado_por: bool,
+    row_keys: pd.Series | None = None,
 ) -> List[StatusChange]:
+    """Turn *pending_labels* (row key -> label) into the status updates to run.
+
+    *row_keys* may carry keys the caller already built for *df*, aligned
+    with its rows; otherwise they are derived here.
+    """
+
     if df.empty or not pending_labels:
         return []
 
-    df = df.copy()
-    df["_ROW_KEY"] = df.apply(build_row_key_from_series, axis=1)
-
-    changes: List[StatusChange] = []
-    lookup = {key: idx for idx, key in enumerate(df["_ROW_KEY"].tolist())}
-
-    for key, label in pending_labels.items():
-        idx = lookup.get(key)
-        if idx is None:
-            continue
-        new_status = STATUS_LABEL_INV.get(label, Status.EM_ANALISE)
-        current_status = str(df.iloc[idx].get("STATUS", "")).upper().strip() or Status.EM_ANALISE
-        if new_status == current_status:
-            continue
-
-        row = df.iloc[idx]
-        base_kwargs = dict(
-            timestamp=row.get("TIMESTAMP"),
-            nome=row.get("NOME"),
-            email=row.get("E-MAIL"),
-            utd=row.get("UTD"),
-            base=row.get("BASE"),
-            servico=row.get("SERVICO"),
-            pacotes=int(row.get("PACOTES", 0)),
-            status=new_status,
+    if row_keys is None:
+        row_keys = build_row_keys_vectorized(df)
+    row_keys = np.asarray(row_keys, dtype=object)
+    # Duplicated keys resolve to their last occurrence, as a dict lookup would.
+    unique_mask = ~pd.Series(row_keys).duplicated(keep="last").to_numpy()
+    positions = np.flatnonzero(unique_mask)
+    indexer = pd.Index(row_keys[unique_mask]).get_indexer(list(pending_labels))
+    hits = np.flatnonzero(indexer != -1)
+    if hits.size == 0:
+        return []
+
+    labels = list(pending_labels.values())
+    new_statuses = [STATUS_LABEL_INV.get(labels[i], Status.EM_ANALISE) for i in hits.tolist()]
+    idx_arr = positions[indexer[hits]]
+    new_codes = np.asarray([_STATUS_CODES[s] for s in new_statuses], dtype=np.int8)
+    if "STATUS" in df.columns:
+        current_codes = _encode_statuses(df["STATUS"])
+    else:
+        current_codes = np.full(len(df), _STATUS_CODES[Status.EM_ANALISE], dtype=np.int8)
+
+    changed = _filter_changes(idx_arr, new_codes, current_codes)
+    if changed.size == 0:
+        return []
+
+    # One positional take for all changed rows instead of an iloc per row.
+    rows = df.iloc[idx_arr[changed]]
+    n_rows = len(rows)
+
+    def _column(name: str) -> list:
+        if name not in rows.columns:
+            return [None] * n_rows
+        # hdbcli binds None, not pd.NA, for NULL text.
+        values = rows[name].astype(object)
+        return values.where(values.notna(), None).tolist()
+
+    pacotes = [int(value) for value in rows["PACOTES"].tolist()] if "PACOTES" in rows.columns else [0] * n_rows
+    statuses = [new_statuses[pos] for pos in changed.tolist()]
+    return [
+        StatusChange(
+            timestamp=timestamp,
+            nome=nome,
+            email=email,
+            utd=utd,
+            base=base,
+            servico=servico,
+            pacotes=pacote,
+            status=status,
+            validado_por=(
+                admin_email if has_validado_por and status in (Status.APROVADO, Status.RECUSADO) else None
+            ),
+        )
+        for timestamp, nome, email, utd, base, servico, pacote, status in zip(
+            _column("TIMESTAMP"),
+            _column("NOME"),
+            _column("E-MAIL"),
+            _column("UTD"),
+            _column("BASE"),
+            _column("SERVICO"),
+            pacotes,
+            statuses,
         )
-        validado_por = None
-        if has_validado_por and new_status in (Status.APROVADO, Status.RECUSADO):
-            validado_por = admin_email
+    ]
 
-        changes.append(StatusChange(validado_por=validado_por, **base_kwargs))
 
-    return changes
+_UPDATE_WHERE = (
+    'WHERE "TIMESTAMP" = ? AND "NOME" = ? AND "E-MAIL" = ? AND "UTD" = ? '
+    'AND "BASE" = ? AND "SERVICO" = ? AND "PACOTES" = ?'
+)
+# Fixed statement text keeps HANA's SQL plan cache hitting across calls.
+SQL_UPDATE_STATUS = f'UPDATE {PEDIDOS_TABLE.fqn()} SET "STATUS" = ? {_UPDATE_WHERE}'
+SQL_UPDATE_STATUS_VALIDADO = f'UPDATE {PEDIDOS_TABLE.fqn()} SET "STATUS" = ?, "VALIDADO_POR" = ? {_UPDATE_WHERE}'
 
-    try:
-        conn = create_connection(cfg, connector)
+
+def update_statuses(
+    changes: Sequence[StatusChange],
+    *,
+    connector: SupportsHanaConnect,
+    config: HanaConfig | None = None,
+    has_validado_por: bool,
+) -> int:
+    """Persist *changes* and return the number of rows sent to HANA."""
+
+    if not changes:
+        return 0
+
+    cfg = config or HanaConfig.from_env()
+    sql = SQL_UPDATE_STATUS_VALIDADO if has_validado_por else SQL_UPDATE_STATUS
+    params = as_param_rows(changes, has_validado_por)
+
+    with pooled_connection(cfg, connector) as conn:
         cur = conn.cursor()
-        cur.executemany(sql, params)
-        conn.commit()
-    finally:
-        if cur is not None:
+        try:
+            cur.executemany(sql, params)
+            conn.commit()
+        finally:
             cur.close()
-        if conn is not None:
-            conn.close()
 
     return len(params)
 
@@ -145,28 +454,72 @@ def table_has_column(
 ) -> bool:
     """Return ``True`` when *column* exists in the pedidos table."""
 
-    cfg = config or HanaConfig.from_env()
-    table = PEDIDOS_TABLE.fqn()
-    sql = f'SELECT * FROM {table} WHERE 1=0'
-
-    conn = None
-    cur = None
     try:
-        conn = create_connection(cfg, connector)
-        cur = conn.cursor()
-        cur.execute(sql)
-        cols = [col[0].upper() for col in cur.description]
+        cols = fetch_pedidos_columns(connector, config)
     except Exception:
         return False
-    finally:
-        if cur is not None:
-            cur.close()
-        if conn is not None:
-            conn.close()
 
     return column.upper() in cols
 
 
+SQL_INSERT_PEDIDO_TURMA = (
+    f"INSERT INTO {PEDIDOS_TABLE.fqn()} "
+    '("TIMESTAMP","NOME","E-MAIL","CADEIA","UTD","BASE","TURMA","ZONA","SERVICO","PACOTES","NOTAS","JUSTIFICATIVA","COMENTARIOS") '
+    "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)"
+)
+SQL_INSERT_PEDIDO = (
+    f"INSERT INTO {PEDIDOS_TABLE.fqn()} "
+    '("TIMESTAMP","NOME","E-MAIL","CADEIA","UTD","BASE","ZONA","SERVICO","PACOTES","NOTAS","JUSTIFICATIVA","COMENTARIOS") '
+    "VALUES (?,?,?,?,?,?,?,?,?,?,?,?)"
+)
+INSERT_BATCH_SIZE = 5000
+
+
+def _column_values(rows: pd.DataFrame, column: str) -> list:
+    if column not in rows.columns:
+        return [None] * len(rows)
+    return rows[column].tolist()
+
+
+def _optional_text_values(rows: pd.DataFrame, column: str) -> list:
+    """Return stripped text per row, with ``None`` for missing or blank cells."""
+
+    if column not in rows.columns:
+        return [None] * len(rows)
+    values = rows[column].to_numpy(dtype=object)
+    present = pd.notna(values)
+    return [(str(value).strip() or None) if ok else None for value, ok in zip(values, present)]
+
+
+def insert_param_rows(rows: pd.DataFrame, has_turma: bool) -> List[tuple]:
+    """Build ``executemany`` parameters for *rows*, one column at a time.
+
+    The column order matches :data:`SQL_INSERT_PEDIDO_TURMA` (or
+    :data:`SQL_INSERT_PEDIDO` when *has_turma* is false).
+    """
+
+    columns = [
+        _column_values(rows, "TIMESTAMP"),
+        _column_values(rows, "NOME"),
+        _column_values(rows, "E-MAIL"),
+        _column_values(rows, "CADEIA"),
+        _column_values(rows, "UTD"),
+        _column_values(rows, "BASE"),
+    ]
+    if has_turma:
+        columns.append(_column_values(rows, "TURMA"))
+    pacotes = rows["PACOTES"].astype(int).tolist() if "PACOTES" in rows.columns else [0] * len(rows)
+    columns += [
+        _column_values(rows, "ZONA"),
+        _column_values(rows, "SERVICO_CLEAN"),
+        pacotes,
+        [None] * len(rows),
+        _optional_text_values(rows, "JUSTIFICATIVA"),
+        _optional_text_values(rows, "COMENTARIO"),
+    ]
+    return list(zip(*columns))
+
+
 def insert_pedidos(
     rows: pd.DataFrame,
     *,
@@ -180,67 +533,18 @@ def insert_pedidos(
 
     cfg = config or HanaConfig.from_env()
     has_turma = table_has_column("TURMA", connector=connector, config=cfg)
-    table = PEDIDOS_TABLE.fqn()
+    sql = SQL_INSERT_PEDIDO_TURMA if has_turma else SQL_INSERT_PEDIDO
+    param_rows = insert_param_rows(rows, has_turma)
 
-    if has_turma:
-        sql = f"""
-        INSERT INTO {table}
-        ("TIMESTAMP","NOME","E-MAIL","CADEIA","UTD","BASE","TURMA","ZONA","SERVICO","PACOTES","NOTAS","JUSTIFICATIVA","COMENTARIOS")
-        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
-        """
-        param_rows = [
-            (
-                row["TIMESTAMP"],
-                row["NOME"],
-                row["E-MAIL"],
-                row["CADEIA"],
-                row["UTD"],
-                row["BASE"],
-                row.get("TURMA"),
-                row.get("ZONA"),
-                row.get("SERVICO_CLEAN"),
-                int(row.get("PACOTES", 0)),
-                None,
-                (str(row.get("JUSTIFICATIVA", "")).strip() or None) if pd.notna(row.get("JUSTIFICATIVA")) else None,
-                (str(row.get("COMENTARIO", "")).strip() or None) if pd.notna(row.get("COMENTARIO")) else None,
-            )
-            for _, row in rows.iterrows()
-        ]
-    else:
-        sql = f"""
-        INSERT INTO {table}
-        ("TIMESTAMP","NOME","E-MAIL","CADEIA","UTD","BASE","ZONA","SERVICO","PACOTES","NOTAS","JUSTIFICATIVA","COMENTARIOS")
-        VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
-        """
-        param_rows = [
-            (
-                row["TIMESTAMP"],
-                row["NOME"],
-                row["E-MAIL"],
-                row["CADEIA"],
-                row["UTD"],
-                row["BASE"],
-                row.get("ZONA"),
-                row.get("SERVICO_CLEAN"),
-                int(row.get("PACOTES", 0)),
-                None,
-                (str(row.get("JUSTIFICATIVA", "")).strip() or None) if pd.notna(row.get("JUSTIFICATIVA")) else None,
-                (str(row.get("COMENTARIO", "")).strip() or None) if pd.notna(row.get("COMENTARIO")) else None,
-            )
-            for _, row in rows.iterrows()
-        ]
-
-    conn = None
-    cur = None
-    try:
-        conn = create_connection(cfg, connector)
+    with pooled_connection(cfg, connector) as conn:
         cur = conn.cursor()
-        cur.executemany(sql, param_rows)
-        conn.commit()
-    finally:
-        if cur is not None:
+        try:
+            # Bounded batches keep each array bind in the driver's bulk path;
+            # a single commit keeps the submission atomic.
+            for start in range(0, len(param_rows), INSERT_BATCH_SIZE):
+                cur.executemany(sql, param_rows[start : start + INSERT_BATCH_SIZE])
+            conn.commit()
+        finally:
             cur.close()
-        if conn is not None:
-            conn.close()
 
     return len(param_rows)
\ No newline at end of file
@@ -8,19 +8,31 @@ from typing import Any, Dict
 import streamlit as st
 import streamlit_authenticator as stauth
 import yaml
-from yaml.loader import SafeLoader
+
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml.loader import SafeLoader
 
 
 @st.cache_data(show_spinner=False)
+def _load_auth_config(path: str, mtime: float) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
 def load_auth_config(path: str = ".streamlit/auth_config.yaml") -> Dict[str, Any]:
-    """Load the authentication configuration file."""
+    """Load the authentication configuration file.
+
+    Parsed once per file modification time, so edits are picked up without
+    clearing the cache.
+    """
 
     cfg_path = Path(path)
     if not cfg_path.exists():
         raise FileNotFoundError("Arquivo de configuração de autenticação não encontrado.")
 
-    with cfg_path.open("r", encoding="utf-8") as f:
-        return yaml.load(f, Loader=SafeLoader)
+    return _load_auth_config(str(cfg_path), cfg_path.stat().st_mtime)
 
 
 def authenticator_from_config(config: Dict[str, Any]) -> stauth.Authenticate:
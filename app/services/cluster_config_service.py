@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
 from typing import Sequence
 
 import pandas as pd
 from hdbcli import dbapi
 
-from app.services.hana import HanaConfig, SupportsHanaConnect, create_connection
+from app.services.hana import HanaConfig, SupportsHanaConnect, pooled_connection
 
 
 SQL_CLUSTER_CONFIG_TEMPLATE = """
@@ -32,15 +33,15 @@ CLUSTER_CONFIG AS (
 ),
 INNER_Q AS (
   SELECT
-    BP.UTD,
+    COALESCE(BP.UTD, '') AS UTD,
     'SIM' AS SELECIONAR,
-    BP.ZONA,
+    COALESCE(BP.ZONA, '') AS ZONA,
     '' AS LOCALI,
     '' AS MUNICIPIO,
     '' AS BAIRRO,
     '' AS TIPO_LOCAL,
-    BP.PACOTES AS CLUSTERS,
-    BP.PACOTES AS PACOTES,
+    COALESCE(BP.PACOTES, 0) AS CLUSTERS,
+    COALESCE(BP.PACOTES, 0) AS PACOTES,
     COALESCE(CNF.QTD_MAX, '15') AS QTD_MAX,
     COALESCE(CNF.QTD_MIN, '10') AS QTD_MIN,
     COALESCE(CNF.RAIO_MIN, '4000') AS RAIO_IDEAL,
@@ -64,10 +65,10 @@ INNER_Q AS (
     '0' AS PESO_QTDFTVE,
     '' AS PREENCHER,
     '' AS QTD_PREENCHER,
-    BP."NOME" AS NOME,
-    BP."E-MAIL" AS EMAIL,
-    BP.BASE AS BASE,
-    BP.SERVICO AS SERVICO,
+    COALESCE(BP."NOME", '') AS NOME,
+    COALESCE(BP."E-MAIL", '') AS EMAIL,
+    COALESCE(BP.BASE, '') AS BASE,
+    COALESCE(BP.SERVICO, '') AS SERVICO,
     BP."TIMESTAMP" AS TS
   FROM "U618488"."BASE_PEDIDOS" BP
   LEFT JOIN BASES S
@@ -96,6 +97,26 @@ ORDER BY TO_DATE(TS) ASC, TO_VARCHAR(TS, 'HH24:MI:SS') ASC
 """
 
 
+@lru_cache(maxsize=64)
+def _cluster_sql(n_turma: int, n_carteira: int) -> str:
+    """Expand the template for the given placeholder counts.
+
+    Reusing the exact same text per shape also lets HANA's plan cache hit.
+    """
+
+    return SQL_CLUSTER_CONFIG_TEMPLATE.format(
+        turma_placeholders=",".join(["?"] * n_turma),
+        carteira_placeholders=",".join(["?"] * n_carteira),
+    )
+
+
+def _cluster_frame(rows: list, cols: list[str]) -> pd.DataFrame:
+    # Text columns are already COALESCEd to '' by the query.  Numeric settings
+    # keep their DECIMAL/text values (coerce_float=False) and are typed once,
+    # by csv_exporter._ensure_numeric_columns.
+    return pd.DataFrame.from_records(rows, columns=cols, coerce_float=False)
+
+
 def fetch_cluster_config(
     sel_date: date,
     turmas: Sequence[str],
@@ -110,27 +131,17 @@ def fetch_cluster_config(
     connector_fn = connector or dbapi.connect
     cfg = config or HanaConfig.from_env()
 
-    turma_placeholders = ",".join(["?"] * len(turmas))
-    carteira_placeholders = ",".join(["?"] * len(carteiras))
-    sql = SQL_CLUSTER_CONFIG_TEMPLATE.format(
-        turma_placeholders=turma_placeholders,
-        carteira_placeholders=carteira_placeholders,
-    )
+    sql = _cluster_sql(len(turmas), len(carteiras))
 
     params: list = [sel_date] + list(turmas) + list(carteiras)
 
-    conn = None
-    cur = None
-    try:
-        conn = create_connection(cfg, connector_fn)
+    with pooled_connection(cfg, connector_fn) as conn:
         cur = conn.cursor()
-        cur.execute(sql, params)
-        rows = cur.fetchall()
-        cols = [c[0] for c in cur.description]
-    finally:
-        if cur is not None:
+        try:
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+            cols = [c[0] for c in cur.description]
+        finally:
             cur.close()
-        if conn is not None:
-            conn.close()
 
-    return pd.DataFrame(rows, columns=cols).fillna("")
+    return _cluster_frame(rows, cols)
@@ -3,24 +3,54 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Dict, List, NamedTuple, Tuple
 
 import pandas as pd
 
-from app.repositories.dag40_repo import fetch_dag40
+from app.repositories.dag40_repo import DAG40_STRING_DTYPES, fetch_dag40
 from app.services.hana import HanaConfig, SupportsHanaConnect
 
 
+def _parquet_path(path: str | os.PathLike[str]) -> Path:
+    """Return the Parquet cache location for *path*.
+
+    Older deployments point ``DAG40_CACHE_PATH`` at a ``.csv`` file; the
+    Parquet cache then lives next to it and the CSV is migrated on first use.
+    """
+
+    cache_path = Path(path)
+    return cache_path.with_suffix(".parquet") if cache_path.suffix.lower() == ".csv" else cache_path
+
+
+def _migrate_legacy_csv(cache_path: Path) -> bool:
+    """Rewrite a CSV cache left by older releases as Parquet.
+
+    Returns ``True`` when a legacy file was found and converted.
+    """
+
+    legacy_path = cache_path.with_suffix(".csv")
+    if legacy_path == cache_path or not legacy_path.exists():
+        return False
+
+    df = pd.read_csv(legacy_path, dtype=str, encoding="utf-8-sig").fillna("")
+    df = df.astype(DAG40_STRING_DTYPES)
+    df.to_parquet(cache_path, engine="pyarrow", compression="zstd", index=False)
+    return True
+
+
 def ensure_cache(path: str | os.PathLike[str], fetcher: Callable[[], pd.DataFrame]) -> None:
     """Ensure the DAG40 cache exists on disk."""
 
-    cache_path = Path(path)
+    cache_path = _parquet_path(path)
     if cache_path.exists():
         return
 
-    df = fetcher()
     cache_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(cache_path, index=False, encoding="utf-8-sig")
+    if _migrate_legacy_csv(cache_path):
+        return
+
+    df = fetcher()
+    df.to_parquet(cache_path, engine="pyarrow", compression="zstd", index=False)
 
 
 def load_dag40(
@@ -36,8 +66,39 @@ def load_dag40(
         return fetch_dag40(connector=connector, config=cfg)
 
     ensure_cache(path, _fetch)
-    if not Path(path).exists():
+    cache_path = _parquet_path(path)
+    if not cache_path.exists():
         raise FileNotFoundError("Não foi possível criar o cache DAG40.")
 
-    df = pd.read_csv(path, dtype=str).fillna("")
-    return df.astype({"UTD": "string", "BASE": "string", "ZONA": "string", "TURMA": "string"})
+    return pd.read_parquet(cache_path).astype(DAG40_STRING_DTYPES)
+
+
+class Dag40Lookups(NamedTuple):
+    """Dictionary views of the DAG40 catalogue used by the request editor."""
+
+    zona_by_key: Dict[Tuple[str, str, str], str]
+    bases_by_utd_turma: Dict[Tuple[str, str], List[str]]
+    utd_options: Tuple[str, ...]
+
+
+def build_dag40_lookups(df: pd.DataFrame) -> Dag40Lookups:
+    """Index *df* by ``(UTD, BASE, TURMA)`` and ``(UTD, TURMA)``.
+
+    The first ZONA listed for a key wins, and UTD/BASE options are sorted
+    case-insensitively without blanks.
+    """
+
+    keyed = df.drop_duplicates(subset=["UTD", "BASE", "TURMA"], keep="first")
+    zona_by_key = dict(zip(zip(keyed["UTD"], keyed["BASE"], keyed["TURMA"]), keyed["ZONA"]))
+
+    bases = df.loc[df["BASE"].notna() & (df["BASE"] != ""), ["UTD", "TURMA", "BASE"]]
+    bases_by_utd_turma = {
+        key: sorted(group.unique().tolist(), key=str.casefold)
+        for key, group in bases.groupby(["UTD", "TURMA"], sort=False)["BASE"]
+    }
+    utd_options = tuple(sorted((u for u in df["UTD"].dropna().unique().tolist() if u), key=str.casefold))
+    return Dag40Lookups(
+        zona_by_key=zona_by_key,
+        bases_by_utd_turma=bases_by_utd_turma,
+        utd_options=utd_options,
+    )
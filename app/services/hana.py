@@ -1,14 +1,19 @@
 """Helpers for interacting with the SAP HANA database used by the project."""
 from __future__ import annotations
 
+import atexit
 import os
+import queue
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Protocol
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Protocol
 
 from dotenv import load_dotenv
 
 
-@dataclass
+@dataclass(frozen=True)
 class HanaConfig:
     host: str
     port: int
@@ -17,17 +22,32 @@ class HanaConfig:
 
     @classmethod
     def from_env(cls) -> "HanaConfig":
-        """Load configuration from ``.env`` files and environment variables."""
+        """Return the configuration loaded from ``.env`` and the environment.
 
-        load_dotenv()
-        port_raw = os.getenv("HANA_PORT", "30015")
-        port = int(port_raw) if str(port_raw).isdigit() else 30015
-        return cls(
-            host=os.getenv("HANA_HOST", ""),
-            port=port,
-            user=os.getenv("HANA_USER", ""),
-            password=os.getenv("HANA_PASS", ""),
-        )
+        The values are read once per process; call :meth:`reload` to pick up
+        changes (mostly useful in tests).
+        """
+
+        return _load_config()
+
+    @classmethod
+    def reload(cls) -> None:
+        """Forget the memoised configuration so the next call re-reads it."""
+
+        _load_config.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _load_config() -> HanaConfig:
+    load_dotenv()
+    port_raw = os.getenv("HANA_PORT", "30015")
+    port = int(port_raw) if str(port_raw).isdigit() else 30015
+    return HanaConfig(
+        host=os.getenv("HANA_HOST", ""),
+        port=port,
+        user=os.getenv("HANA_USER", ""),
+        password=os.getenv("HANA_PASS", ""),
+    )
 
 
 class SupportsHanaConnect(Protocol):
@@ -55,3 +75,112 @@ def create_connection(config: HanaConfig, connector: SupportsHanaConnect) -> Any
         raise RuntimeError("Defina HANA_HOST, HANA_USER e HANA_PASS no .env.")
 
     return connector(address=config.host, port=config.port, user=config.user, password=config.password)
+
+
+def _pool_size_from_env() -> int:
+    raw = os.getenv("HANA_POOL_SIZE", "4")
+    return max(int(raw), 1) if raw.isdigit() else 4
+
+
+def _is_alive(conn: Any) -> bool:
+    is_connected = getattr(conn, "isconnected", None)
+    if is_connected is None:
+        return True
+    try:
+        return bool(is_connected())
+    except Exception:
+        return False
+
+
+def _close_quietly(conn: Any) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+class HanaPool:
+    """Keep up to *size* idle connections around for reuse.
+
+    Connections are leased with :meth:`acquire`; a connection that raised
+    while leased is closed instead of being returned (and the idle ones are
+    dropped too when it lost its session), and idle connections that report
+    ``isconnected() == False`` are replaced transparently.
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int) -> None:
+        self._factory = factory
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue(maxsize=size)
+
+    def _take(self) -> Any:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return self._factory()
+            if _is_alive(conn):
+                return conn
+            _close_quietly(conn)
+
+    def _give_back(self, conn: Any) -> None:
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            _close_quietly(conn)
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        conn = self._take()
+        try:
+            yield conn
+        except BaseException:
+            if not _is_alive(conn):
+                # The session was dropped (server restart, network cut): the
+                # idle siblings are most likely stale too, so reconnect fresh.
+                self.close_all()
+            _close_quietly(conn)
+            raise
+        self._give_back(conn)
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            _close_quietly(conn)
+
+
+_POOLS: dict[tuple[HanaConfig, SupportsHanaConnect], HanaPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(config: HanaConfig, connector: SupportsHanaConnect) -> HanaPool:
+    """Return the process-wide pool for *config* and *connector*."""
+
+    key = (config, connector)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = HanaPool(lambda: create_connection(config, connector), _pool_size_from_env())
+            _POOLS[key] = pool
+        return pool
+
+
+@contextmanager
+def pooled_connection(config: HanaConfig, connector: SupportsHanaConnect) -> Iterator[Any]:
+    """Lease a connection from the pool matching *config* and *connector*."""
+
+    with get_pool(config, connector).acquire() as conn:
+        yield conn
+
+
+@atexit.register
+def close_all_pools() -> None:
+    """Close every idle pooled connection (registered to run at exit)."""
+
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close_all()
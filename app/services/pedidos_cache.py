@@ -1,53 +1,101 @@
 from __future__ import annotations
 
+from datetime import date
+
 import pandas as pd
 import streamlit as st
 from hdbcli import dbapi
 
+from app.repositories.pedidos_repo import PedidosFilter, clear_pedidos_columns_cache
 from app.services.hana import HanaConfig
-from app.services.pedidos_service import fetch_pedidos_with_labels
+from app.services.pedidos_service import (
+    PEDIDOS_UI_COLUMNS,
+    PedidosFilterOptions,
+    add_admin_columns,
+    add_view_columns,
+    fetch_filter_options,
+    fetch_pedidos_with_labels,
+    normalize_pedidos_for_ui,
+)
 
 
 @st.cache_data(ttl=15, show_spinner=False)
+def fetch_pedidos_view_cached() -> pd.DataFrame:
+    """Return all pedidos, sorted by ``TIMESTAMP``, with the view columns.
+
+    The derived columns are added inside the single cached call, so there is
+    one copy of the table and one TTL.
+    """
+
+    cfg = HanaConfig.from_env()
+    df = fetch_pedidos_with_labels(connector=dbapi.connect, config=cfg)
+    return add_view_columns(normalize_pedidos_for_ui(df))
+
+
 def fetch_all_pedidos_cached() -> pd.DataFrame:
     """Return all pedidos with human-friendly status labels."""
 
+    df = fetch_pedidos_view_cached()
+    return df[[c for c in PEDIDOS_UI_COLUMNS if c in df.columns]]
+
+
+def fetch_pedidos_admin_view() -> pd.DataFrame:
+    """Return :func:`fetch_pedidos_view_cached` plus the Gestão columns.
+
+    Only the pending-changes fallback needs the full admin frame, so the
+    columns are derived on demand from the shared view entry instead of being
+    cached as another copy.
+    """
+
+    return add_admin_columns(fetch_pedidos_view_cached())
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _fetch_filtered_pedidos_cached(
+    day: date | None,
+    utds: tuple[str, ...],
+    bases: tuple[str, ...],
+    statuses: tuple[str, ...],
+    email_contains: str,
+) -> pd.DataFrame:
     cfg = HanaConfig.from_env()
-    df = fetch_pedidos_with_labels(connector=dbapi.connect, config=cfg)
-    if "PACOTES" in df.columns:
-        df["PACOTES"] = pd.to_numeric(df["PACOTES"], errors="coerce").fillna(0).astype(int)
-    if "STATUS" not in df.columns:
-        df["STATUS"] = "EM ANALISE"
-    for column in ["TURMA", "VALIDADO_POR"]:
-        if column not in df.columns:
-            df[column] = ""
-    desired_cols = [
-        "TIMESTAMP",
-        "NOME",
-        "E-MAIL",
-        "CADEIA",
-        "UTD",
-        "BASE",
-        "ZONA",
-        "SERVICO",
-        "PACOTES",
-        "JUSTIFICATIVA",
-        "COMENTARIOS",
-        "STATUS",
-        "TURMA",
-        "VALIDADO_POR",
-        "STATUS_LABEL",
-    ]
-    existing_cols = [c for c in desired_cols if c in df.columns]
-    df = df[existing_cols]
-    existing_cols = [c for c in desired_cols if c in df.columns]
-    df = df[existing_cols]
-    if "TIMESTAMP" not in df.columns:
-        return df  # or: raise ValueError("TIMESTAMP column is required")
-    return df.sort_values("TIMESTAMP", ascending=True)
+    filters = PedidosFilter(day, utds, bases, statuses, email_contains)
+    df = fetch_pedidos_with_labels(connector=dbapi.connect, config=cfg, filters=filters)
+    return add_admin_columns(add_view_columns(normalize_pedidos_for_ui(df)))
+
+
+def fetch_filtered_pedidos_cached(filters: PedidosFilter) -> pd.DataFrame:
+    """Return the pedidos matching *filters*, filtered by HANA.
+
+    Same columns as :func:`fetch_pedidos_admin_view`, cached per
+    filter combination.
+    """
+
+    return _fetch_filtered_pedidos_cached(
+        filters.day,
+        tuple(filters.utds),
+        tuple(filters.bases),
+        tuple(filters.statuses),
+        filters.email_contains,
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_pedidos_filter_options_cached() -> PedidosFilterOptions:
+    """Return the UTD/BASE filter options and the latest pedido day.
+
+    New UTDs/BASEs are rare, so the longer TTL is fine; writes from this app
+    still invalidate it through :func:`clear_pedidos_cache`.
+    """
+
+    cfg = HanaConfig.from_env()
+    return fetch_filter_options(connector=dbapi.connect, config=cfg)
 
 
 def clear_pedidos_cache() -> None:
-    """Invalidate the cached pedidos dataset."""
+    """Invalidate the cached pedidos dataset and the table's column names."""
 
-    fetch_all_pedidos_cached.clear()
+    fetch_pedidos_view_cached.clear()
+    _fetch_filtered_pedidos_cached.clear()
+    fetch_pedidos_filter_options_cached.clear()
+    clear_pedidos_columns_cache()
@@ -1,30 +1,147 @@
 """High level service for pedidos administration."""
 from __future__ import annotations
 
-from typing import Dict
-from typing import Dict
+from datetime import date
+from typing import Dict, NamedTuple, Tuple
 
+import numpy as np
 import pandas as pd
 
+from app.models.pedido import build_row_keys_vectorized
 from app.repositories.pedidos_repo import (
+    PedidosFilter,
     build_status_changes,
     fetch_pedidos,
+    fetch_filter_values,
+    fetch_pedidos_columns,
     insert_pedidos,
+    normalize_status,
     table_has_column,
     update_statuses,
 )
 from app.services.hana import HanaConfig, SupportsHanaConnect
-from app.utils.constants import STATUS_LABEL_MAP
+from app.utils.constants import STATUS_LABEL_MAP, Status
 
 
 def fetch_pedidos_with_labels(
     connector: SupportsHanaConnect,
     config: HanaConfig | None = None,
+    filters: PedidosFilter | None = None,
 ) -> pd.DataFrame:
-    df = fetch_pedidos(connector=connector, config=config)
-    df = df.copy()
-    df["STATUS_LABEL"] = df["STATUS"].map(lambda v: STATUS_LABEL_MAP.get(str(v).upper().strip(), "🟡 Pendente"))
-    return df
+    df = fetch_pedidos(connector=connector, config=config, filters=filters)
+    # STATUS is already upper-cased and trimmed by the SELECT; the domain is
+    # tiny, so a handful of boolean masks beats a per-row lookup.
+    status = df["STATUS"].to_numpy(dtype=object)
+    labels = np.select(
+        [status == db_value for db_value in STATUS_LABEL_MAP],
+        list(STATUS_LABEL_MAP.values()),
+        default=STATUS_LABEL_MAP[Status.EM_ANALISE],
+    )
+    return df.assign(STATUS_LABEL=labels)
+
+
+PEDIDOS_UI_COLUMNS = [
+    "TIMESTAMP",
+    "NOME",
+    "E-MAIL",
+    "CADEIA",
+    "UTD",
+    "BASE",
+    "ZONA",
+    "SERVICO",
+    "PACOTES",
+    "JUSTIFICATIVA",
+    "COMENTARIOS",
+    "STATUS",
+    "TURMA",
+    "VALIDADO_POR",
+    "STATUS_LABEL",
+]
+
+
+def normalize_pedidos_for_ui(df: pd.DataFrame) -> pd.DataFrame:
+    """Project *df* onto :data:`PEDIDOS_UI_COLUMNS` sorted by ``TIMESTAMP``.
+
+    ``PACOTES`` and ``STATUS`` are already normalised by
+    :func:`fetch_pedidos`; here we only fill optional columns that older
+    tables may lack.
+    """
+
+    missing = {column: "" for column in ("TURMA", "VALIDADO_POR") if column not in df.columns}
+    if missing:
+        df = df.assign(**missing)
+    df = df[[c for c in PEDIDOS_UI_COLUMNS if c in df.columns]]
+    if "TIMESTAMP" not in df.columns:
+        return df
+    return df.sort_values("TIMESTAMP", ascending=True, kind="stable", ignore_index=True)
+
+
+def add_view_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Return *df* with the derived columns the pages filter and display on.
+
+    ``TS_DT``/``DATA_HORA`` are the parsed and formatted timestamp,
+    ``TS_DAY`` the local calendar day as ``datetime64[D]`` (so date filters
+    are numpy comparisons) and ``_EMAIL_LC`` the lower-cased e-mail.
+    """
+
+    ts_dt = pd.to_datetime(df["TIMESTAMP"], errors="coerce")
+    ts_local = ts_dt.dt.tz_localize(None) if ts_dt.dt.tz else ts_dt
+    return df.assign(
+        TS_DT=ts_dt,
+        DATA_HORA=ts_dt.dt.strftime("%d/%m/%Y %H:%M"),
+        TS_DAY=ts_local.to_numpy().astype("datetime64[D]"),
+        _EMAIL_LC=df["E-MAIL"].fillna("").astype(str).str.lower(),
+    )
+
+
+def add_admin_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Return *df* with the columns the Gestão page filters and keys rows on.
+
+    ``STATUS_NORM`` maps blank/placeholder statuses to ``EM ANALISE`` and
+    ``_ROW_KEY`` is the selection/update key of each row.
+    """
+
+    return df.assign(
+        STATUS_NORM=normalize_status(df["STATUS"]),
+        _ROW_KEY=build_row_keys_vectorized(df),
+    )
+
+
+class PedidosFilterOptions(NamedTuple):
+    """Sorted UTD/BASE choices and the default day for the pedidos filters."""
+
+    utd: Tuple[str, ...]
+    base: Tuple[str, ...]
+    latest_day: date | None = None
+
+
+def _sorted_options(values: pd.Series) -> Tuple[str, ...]:
+    return tuple(sorted((v for v in values.dropna().unique().tolist() if v), key=str.casefold))
+
+
+def build_filter_options(df: pd.DataFrame) -> PedidosFilterOptions:
+    """Return the case-insensitively sorted, non-blank UTD and BASE values of *df*.
+
+    For pages that already hold the full frame, so the options always match
+    the rows on screen.
+    """
+
+    return PedidosFilterOptions(utd=_sorted_options(df["UTD"]), base=_sorted_options(df["BASE"]))
+
+
+def fetch_filter_options(
+    *,
+    connector: SupportsHanaConnect,
+    config: HanaConfig | None = None,
+) -> PedidosFilterOptions:
+    """Return the filter choices from ``SELECT DISTINCT`` queries.
+
+    Used by Gestão, which filters in HANA and never loads the full table.
+    """
+
+    utds, bases, latest_day = fetch_filter_values(connector=connector, config=config)
+    return PedidosFilterOptions(utd=tuple(utds), base=tuple(bases), latest_day=latest_day)
+
 
 def apply_status_changes(
     df: pd.DataFrame,
@@ -34,12 +151,14 @@ def apply_status_changes(
     has_validado_por: bool,
     connector: SupportsHanaConnect,
     config: HanaConfig | None = None,
+    row_keys: pd.Series | None = None,
 ) -> int:
     changes = build_status_changes(
         df,
         pending_labels,
         admin_email=admin_email,
         has_validado_por=has_validado_por,
+        row_keys=row_keys,
     )
     if not changes:
         return 0
@@ -51,6 +170,7 @@ def apply_status_changes(
         has_validado_por=has_validado_por,
     )
 
+
 def pedidos_table_has_column(
     column: str,
     *,
@@ -62,6 +182,19 @@ def pedidos_table_has_column(
     return table_has_column(column, connector=connector, config=config)
 
 
+def pedidos_table_columns(
+    *,
+    connector: SupportsHanaConnect,
+    config: HanaConfig | None = None,
+) -> frozenset[str]:
+    """Return the pedidos column names, or an empty set when the lookup fails."""
+
+    try:
+        return fetch_pedidos_columns(connector, config)
+    except Exception:
+        return frozenset()
+
+
 def insert_pedidos_rows(
     rows: pd.DataFrame,
     *,
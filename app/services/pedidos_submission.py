@@ -3,10 +3,12 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 from app.utils.time_windows import TZ
 from app.utils.validators import (
+    normalize_email,
     strip_accents_and_punct_action,
     strip_accents_and_punct_name,
 )
@@ -21,6 +23,7 @@ def prepare_submission_dataframe(
     email: str,
     turma: str,
     after_1055: bool,
+    timestamp: datetime | None = None,
 ) -> pd.DataFrame:
     """Validate *lines_df* and return the payload ready for insertion."""
 
@@ -28,24 +31,34 @@ def prepare_submission_dataframe(
         raise ValueError("Nenhuma linha para enviar. Adicione ao menos uma BASE e configure os serviços.")
 
     df = lines_df.copy()
-    for column in REQUIRED_COLUMNS:
-        if df[column].isna().any() or (df[column].astype(str).str.strip() == "").any():
-            raise ValueError(f"Há linhas com **{column}** vazio.")
+    # One missing/blank mask over all required columns at once.
+    required = df[REQUIRED_COLUMNS].to_numpy(dtype=object)
+    empty = pd.isna(required) | (np.char.strip(required.astype(str)) == "")
+    empty_columns = empty.any(axis=0)
+    if empty_columns.any():
+        column = REQUIRED_COLUMNS[int(np.argmax(empty_columns))]
+        raise ValueError(f"Há linhas com **{column}** vazio.")
 
-    if after_1055 and (df["GERACAO_PARA"].astype(str).str.upper().str.strip() == "HOJE").any():
+    geracao = np.char.upper(np.char.strip(df["GERACAO_PARA"].to_numpy(dtype=str)))
+    if after_1055 and (geracao == "HOJE").any():
         raise ValueError("Após 10:55, **HOJE** não é permitido. Altere para **AMANHÃ** ou **FIM DE SEMANA**.")
 
-    df["PACOTES"] = pd.to_numeric(df["PACOTES"], errors="coerce").fillna(0).astype(int)
+    pacotes = df["PACOTES"]
+    # The editor already stores PACOTES as integers; coerce only foreign input.
+    if not pd.api.types.is_integer_dtype(pacotes) or pacotes.hasnans:
+        df["PACOTES"] = pd.to_numeric(pacotes, errors="coerce").fillna(0).astype(int)
     if (df["PACOTES"] < 1).any():
         raise ValueError("Há linhas com **PACOTES** inválidos (mín. 1).")
 
     nome_norm = strip_accents_and_punct_name(nome)
-    email_norm = email.strip().lower()
+    email_norm = normalize_email(email)
 
-    df["SERVICO_CLEAN"] = df["SERVIÇO"].apply(strip_accents_and_punct_action)
-    df["GERACAO_PARA"] = df["GERACAO_PARA"].astype(str).str.upper().str.strip()
+    # Only a handful of distinct services exist, so normalise each one once.
+    servicos = df["SERVIÇO"]
+    df["SERVICO_CLEAN"] = servicos.map({value: strip_accents_and_punct_action(value) for value in servicos.unique()})
+    df["GERACAO_PARA"] = geracao
 
-    timestamp = datetime.now(TZ)
+    timestamp = timestamp or datetime.now(TZ)
     out = df.copy()
     out.insert(0, "TIMESTAMP", timestamp)
     out.insert(1, "NOME", nome_norm)
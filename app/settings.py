@@ -8,4 +8,4 @@ PAGE_ICON = "🧾"
 PAGE_LAYOUT = "wide"
 
 TZ = ZoneInfo("America/Bahia")
-CACHE_PATH = os.getenv("DAG40_CACHE_PATH", "dag40_cache.csv")
+CACHE_PATH = os.getenv("DAG40_CACHE_PATH", "dag40_cache.parquet")
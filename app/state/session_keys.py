@@ -5,7 +5,7 @@ from __future__ import annotations
 FULL_RESET_FLAG = "_do_full_reset"
 
 # Solicitation page keys
-REQUEST_LINES = "lines_df"
+REQUEST_ROWS = "lines_rows"
 REQUEST_EDITOR_KEY = "editor_lines_v2"
 UTD_BASE_SELECTION = "utd_base_sel"
 SUCCESS_QUANTITY = "success_qtd"
@@ -33,7 +33,7 @@ ADMIN_EMAIL_FILTER = "f_email_admin"
 ADMIN_STATUS_FILTER = "f_status_admin"
 ADMIN_EDITOR_KEY = "admin_editor_v2"
 ADMIN_PENDING_CHANGES = "admin_pending_changes"
-ADMIN_INDEX_TO_KEY = "admin_index_to_key"
+ADMIN_ROW_KEYS = "admin_row_keys"
 ADMIN_LAST_APPLY = "admin_last_apply_success"
 CSV_SELECTION = "csv_row_selection"
 ADMIN_EMAIL = "admin_email"
@@ -1,23 +1,24 @@
 """Streamlit cache helpers used across pages."""
 from __future__ import annotations
 
-import os
-from functools import lru_cache
+from datetime import date
+from typing import Sequence
 
 import pandas as pd
 import streamlit as st
 from hdbcli import dbapi
 
-from app.services.dag40_service import load_dag40
+from app.services.cluster_config_service import fetch_cluster_config
+from app.services.dag40_service import Dag40Lookups, build_dag40_lookups, load_dag40
 from app.services.hana import HanaConfig
-from app.services.pedidos_service import fetch_pedidos_with_labels
+from app.services.pedidos_cache import fetch_all_pedidos_cached, fetch_pedidos_view_cached
+from app.settings import CACHE_PATH
 
 
-@lru_cache(maxsize=1)
 def dag40_cache_path() -> str:
     """Return the path where the DAG40 cache should live."""
 
-    return os.getenv("DAG40_CACHE_PATH", "dag40_cache.csv")
+    return CACHE_PATH
 
 
 @st.cache_data(show_spinner=False)
@@ -29,37 +30,53 @@ def load_dag40_cached() -> pd.DataFrame:
     return load_dag40(path, connector=dbapi.connect, config=cfg)
 
 
-@st.cache_data(ttl=15, show_spinner=False)
+@st.cache_resource(show_spinner=False)
+def load_dag40_lookups_cached() -> Dag40Lookups:
+    """Return the ZONA/BASE dictionaries built from :func:`load_dag40_cached`.
+
+    Held as a shared resource (no per-call copy); callers must not mutate it.
+    """
+
+    return build_dag40_lookups(load_dag40_cached())
+
+
 def fetch_pedidos_cached() -> pd.DataFrame:
-    """Fetch pedidos with status labels and cache them for a short period."""
+    """Fetch pedidos with status labels, cached for a short period.
+
+    Shares the cache entry of :func:`fetch_all_pedidos_cached` so every page
+    reuses the same normalised dataset.
+    """
+
+    return fetch_all_pedidos_cached()
+
+
+def fetch_pedidos_with_dates_cached() -> pd.DataFrame:
+    """Like :func:`fetch_pedidos_cached`, plus the derived date/e-mail columns."""
 
+    return fetch_pedidos_view_cached()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_cluster_config_cached(
+    sel_date: date,
+    turmas: tuple[str, ...],
+    carteiras: tuple[str, ...],
+) -> pd.DataFrame:
     cfg = HanaConfig.from_env()
-    df = fetch_pedidos_with_labels(connector=dbapi.connect, config=cfg)
-    if "PACOTES" in df.columns:
-        df["PACOTES"] = pd.to_numeric(df["PACOTES"], errors="coerce").fillna(0).astype(int)
-    if "STATUS" not in df.columns:
-        df["STATUS"] = "EM ANALISE"
-    for column in ["TURMA", "VALIDADO_POR"]:
-        if column not in df.columns:
-            df[column] = ""
-    desired_cols = [
-        "TIMESTAMP",
-        "NOME",
-        "E-MAIL",
-        "CADEIA",
-        "UTD",
-        "BASE",
-        "ZONA",
-        "SERVICO",
-        "PACOTES",
-        "JUSTIFICATIVA",
-        "COMENTARIOS",
-        "STATUS",
-        "TURMA",
-        "VALIDADO_POR",
-    ]
-    existing_cols = [c for c in desired_cols if c in df.columns]
-    result = df[existing_cols].copy()
-    if "TIMESTAMP" in result.columns:
-        result = result.sort_values("TIMESTAMP", ascending=True)
-    return result
+    return fetch_cluster_config(sel_date, turmas, carteiras, connector=dbapi.connect, config=cfg)
+
+
+def fetch_cluster_config_cached(
+    sel_date: date,
+    turmas: Sequence[str],
+    carteiras: Sequence[str],
+) -> pd.DataFrame:
+    """Return the cluster configuration rows, cached per filter combination."""
+
+    return _fetch_cluster_config_cached(sel_date, tuple(turmas), tuple(carteiras))
+
+
+def clear_cluster_config_cache() -> None:
+    """Invalidate the cached cluster configuration results."""
+
+    _fetch_cluster_config_cached.clear()
@@ -20,7 +20,7 @@ DEFAULT_SERVICOS = [
 
 BASE_GERACAO_OPCOES = ["HOJE", "AMANHÃ", "FIM DE SEMANA"]
 
-ALLOWED_ADMINS = {
+ALLOWED_ADMINS = frozenset({
     "joao.almeida@neoenergia.com",
     "luiz.espozel@neoenergia.com",
     "pedro.azevedo@neoenergia.com",
@@ -29,7 +29,7 @@ ALLOWED_ADMINS = {
     "dsaraujo@neoenergia.com",
     "madson.melo@neoenergia.com",
     "jsbrito@neoenergia.com",
-}
+})
 
 class Status:
     """Enumeration for status values stored in the HANA database."""
@@ -1,36 +1,43 @@
 """Utilities for reasoning about time windows enforced by the UI."""
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import datetime, time as dtime
-from zoneinfo import ZoneInfo
+from functools import lru_cache
+from typing import NamedTuple
 
+from app.settings import TZ
 from app.utils.constants import BASE_GERACAO_OPCOES
 
 
-TZ = ZoneInfo("America/Bahia")
+_CUTOFF_10 = dtime(10, 0)
+_CUTOFF_1055 = dtime(10, 55)
+_OPCOES_ALL = tuple(BASE_GERACAO_OPCOES)
+_OPCOES_NO_HOJE = tuple(option for option in BASE_GERACAO_OPCOES if option != "HOJE")
 
 
-@dataclass(frozen=True)
-class TimeWindow:
+class TimeWindow(NamedTuple):
     """Represents the operational flags for the request workflow."""
 
     after_10: bool
     after_1055: bool
-    available_options: list[str]
+    available_options: tuple[str, ...]
     default_option: str
 
 
 def current_time_window(now: datetime | None = None) -> TimeWindow:
-    """Return the :class:`TimeWindow` for *now* in the Bahia timezone."""
-
-    now = now or datetime.now(TZ)
-    after_10 = now.time() >= dtime(10, 0)
-    after_1055 = now.time() >= dtime(10, 55)
-    available = [
-        option
-        for option in BASE_GERACAO_OPCOES
-        if not (after_1055 and option == "HOJE")
-    ]
+    """Return the :class:`TimeWindow` for *now* in the Bahia timezone.
+
+    Pages compute ``datetime.now(TZ)`` once per rerun and pass it here so the
+    clock is read a single time.
+    """
+
+    clock = (now or datetime.now(TZ)).time()
+    return _window_for(clock >= _CUTOFF_10, clock >= _CUTOFF_1055)
+
+
+@lru_cache(maxsize=None)
+def _window_for(after_10: bool, after_1055: bool) -> TimeWindow:
+    # Only three flag combinations exist, so each window is built once per process.
+    available = _OPCOES_NO_HOJE if after_1055 else _OPCOES_ALL
     default = available[0] if available else "AMANHÃ"
     return TimeWindow(after_10=after_10, after_1055=after_1055, available_options=available, default_option=default)
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
 
 __all__ = [
     "strip_accents",
@@ -17,12 +18,21 @@ __all__ = [
     "strip_accents_and_punct_action",
     "is_valid_name",
     "is_valid_email",
+    "normalize_email",
 ]
 
 
 _NON_ALPHA_REGEX = re.compile(r"[^A-Za-z\s]")
 _NON_ALNUM_REGEX = re.compile(r"[^A-Za-z0-9\s]")
-_EMAIL_REGEX = re.compile(r"^[a-z0-9.\_%\+\-]+@neoenergia\.com$")
+_EMAIL_DOMAIN = "@neoenergia.com"
+_EMAIL_LOCAL_ALLOWED = frozenset("abcdefghijklmnopqrstuvwxyz0123456789._%+-")
+
+
+# Streamlit reruns the whole script on every widget interaction, so the same
+# handful of names/e-mails/services is normalised over and over.  The pure
+# helpers below are memoised on their (always ``str``) input; the public
+# wrappers coerce ``None`` and other non-strings first.
+_CACHE_SIZE = 2048
 
 
 def strip_accents(value: str | None) -> str:
@@ -35,36 +45,110 @@ def strip_accents(value: str | None) -> str:
 
     if not isinstance(value, str):
         return ""
+    return _strip_accents(value)
+
 
+def _nfkd_strip(value: str) -> str:
     normalized = unicodedata.normalize("NFKD", value)
     return "".join(char for char in normalized if not unicodedata.combining(char))
 
 
+def _build_accent_map() -> dict[int, str]:
+    """Map every Latin-1/Latin Extended-A letter to its unaccented ASCII form.
+
+    Derived from the NFKD path so both produce identical output; characters
+    that do not reduce to ASCII (``ß``, ``Ø``...) are left to the fallback.
+    """
+
+    table: dict[int, str] = {}
+    for code in range(0x00A0, 0x0180):
+        char = chr(code)
+        stripped = _nfkd_strip(char)
+        if stripped != char and stripped.isascii():
+            table[code] = stripped
+    return table
+
+
+_ACCENT_MAP = _build_accent_map()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _strip_accents(value: str) -> str:
+    if value.isascii():
+        # Nothing to decompose; skips NFKD for the common corporate input.
+        return value
+
+    translated = value.translate(_ACCENT_MAP)
+    if translated.isascii():
+        return translated
+    return _nfkd_strip(translated)
+
+
 def _strip_and_normalise_whitespace(value: str) -> str:
     """Condense consecutive whitespace into a single space and trim."""
 
-    value = re.sub(r"\s+", " ", value)
-    return value.strip()
+    return " ".join(value.split())
+
+
+def _build_fused_table(*, keep_digits: bool) -> dict[int, str]:
+    """Build a table that strips accents, uppercases and blanks punctuation.
+
+    Covers every code point below ``0x180`` (ASCII, Latin-1 and Latin
+    Extended-A); other characters take the general path.
+    """
+
+    table: dict[int, str] = {}
+    for code in range(0x0180):
+        char = chr(code)
+        base = char if char.isascii() else _nfkd_strip(char)
+        table[code] = "".join(
+            ch.upper()
+            if ("A" <= ch <= "Z" or "a" <= ch <= "z" or (keep_digits and "0" <= ch <= "9"))
+            else " "
+            for ch in base
+        )
+    return table
+
+
+_NAME_TABLE = _build_fused_table(keep_digits=False)
+_ACTION_TABLE = _build_fused_table(keep_digits=True)
+
+
+def _fused_normalise(value: str, table: dict[int, str], pattern: re.Pattern[str]) -> str:
+    translated = value.translate(table)
+    if translated.isascii():
+        # One translate pass replaces NFKD, the punctuation regex and upper().
+        return _strip_and_normalise_whitespace(translated)
+    # Only the code points the table left untouched still need NFKD.
+    cleaned = pattern.sub(" ", _strip_accents(translated))
+    return _strip_and_normalise_whitespace(cleaned).upper()
 
 
 def strip_accents_and_punct_name(value: str | None) -> str:
     """Return a normalised name suitable for validation and comparisons."""
 
-    no_accents = strip_accents(value or "")
-    cleaned = _NON_ALPHA_REGEX.sub(" ", no_accents)
-    return _strip_and_normalise_whitespace(cleaned).upper()
+    return _strip_accents_and_punct_name(value if isinstance(value, str) else "")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _strip_accents_and_punct_name(value: str) -> str:
+    return _fused_normalise(value, _NAME_TABLE, _NON_ALPHA_REGEX)
 
 
 def strip_accents_and_punct_action(value: str | None) -> str:
     """Return a normalised action/service description."""
 
-    no_accents = strip_accents(value or "")
-    cleaned = _NON_ALNUM_REGEX.sub(" ", no_accents)
-    return _strip_and_normalise_whitespace(cleaned).upper()
+    return _strip_accents_and_punct_action(value if isinstance(value, str) else "")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _strip_accents_and_punct_action(value: str) -> str:
+    return _fused_normalise(value, _ACTION_TABLE, _NON_ALNUM_REGEX)
 
 
 def _count_words(value: str) -> int:
-    return len([word for word in value.split(" ") if word])
+    # *value* is already normalised: single spaces, nothing leading/trailing.
+    return value.count(" ") + 1 if value else 0
 
 
 def is_valid_name(name: str | None) -> bool:
@@ -75,14 +159,45 @@ def is_valid_name(name: str | None) -> bool:
     of the input.
     """
 
-    cleaned = strip_accents_and_punct_name(name or "")
+    return _is_valid_name(name if isinstance(name, str) else "")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _is_valid_name(name: str) -> bool:
+    stripped = name.strip()
+    if stripped.isascii() and (len(stripped) < 3 or stripped.isalpha()):
+        # Two ASCII words need at least "A B"; letters alone form a single
+        # word.  Non-ASCII input can expand under NFKD, so it takes the full path.
+        return False
+    cleaned = _strip_accents_and_punct_name(name)
     return _count_words(cleaned) >= 2
 
 
+def normalize_email(email: str | None) -> str:
+    """Return *email* trimmed and lower-cased (``""`` for non-strings)."""
+
+    return _normalize_email(email) if isinstance(email, str) else ""
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
 def is_valid_email(email: str | None) -> bool:
     """Validate ``@neoenergia.com`` corporate e-mail addresses."""
 
     if not isinstance(email, str):
         return False
 
-    return bool(_EMAIL_REGEX.match(email.strip().lower()))
+    return _is_valid_email(email)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _is_valid_email(email: str) -> bool:
+    # A fixed domain plus a character whitelist needs no regex engine.
+    email = _normalize_email(email)
+    if not email.endswith(_EMAIL_DOMAIN):
+        return False
+    local = email[: -len(_EMAIL_DOMAIN)]
+    return bool(local) and _EMAIL_LOCAL_ALLOWED.issuperset(local)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+
+@pytest.fixture(scope="module")
+def streamlit_stub():
+    """Install a minimal ``streamlit`` module when the real one is unavailable."""
+
+    with pytest.MonkeyPatch.context() as mp:
+        if "streamlit" not in sys.modules:
+            stub = types.ModuleType("streamlit")
+            stub.session_state = {}
+            stub.rerun = lambda: None
+            mp.setitem(sys.modules, "streamlit", stub)
+        yield sys.modules["streamlit"]
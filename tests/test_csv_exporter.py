@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from app.exporters.csv_exporter import generate_csv_payloads
+
+
+def _cluster_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "UTD": ["ITAPOAN", "ITAPOAN", "CAMACARI"],
+            "SELECIONAR": ["SIM", "NAO", "SIM"],
+            "ZONA": ["Z1", "Z2", None],
+            "CLUSTERS": ["2", "1", "3"],
+            "CARTEIRA": ["CONVENCIONAL", "CONVENCIONAL", "COB.DOM"],
+            "TURMA": ["STC", "STC", "EPS"],
+            "NOME": ["MARIA SILVA", "JOAO SOUZA", "ANA LIMA"],
+            "TS": ["2024-01-01 08:00:00", "2024-01-01 09:00:00", "2024-01-01 10:00:00"],
+        }
+    )
+
+
+def test_payloads_match_pandas_csv_output():
+    payloads = generate_csv_payloads(_cluster_df())
+
+    assert [p.file_name for p in payloads] == ["config_eps_domiciliar.csv", "config_stc_convencional.csv"]
+    assert payloads[1].content == "\ufeffUTD;SELECIONAR;ZONA;CLUSTERS;CARTEIRA;TURMA\nITAPOAN;SIM;Z1;2;CONVENCIONAL;STC\n".encode()
+    assert payloads[0].content == "\ufeffUTD;SELECIONAR;ZONA;CLUSTERS;CARTEIRA;TURMA\nCAMACARI;SIM;;3;COB.DOM;EPS\n".encode()
+
+
+def test_values_needing_quotes_fall_back_to_pandas():
+    df = _cluster_df().assign(ZONA=["Z;1", "Z2", None])
+
+    payload = generate_csv_payloads(df, exclude_unselected=False)[1]
+
+    assert b'"Z;1"' in payload.content
+    assert payload.content.startswith("\ufeff".encode())
+    assert b"\r\n" not in payload.content
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from app.services.dag40_service import build_dag40_lookups, ensure_cache, load_dag40
+
+
+def _unreachable_connector(**_kwargs):
+    raise AssertionError("HANA should not be queried when the cache exists")
+
+
+def _unreachable_fetcher() -> pd.DataFrame:
+    raise AssertionError("fetcher should not run when a legacy CSV exists")
+
+
+def test_legacy_csv_cache_is_migrated_to_parquet(tmp_path):
+    cache_path = tmp_path / "dag40_cache.parquet"
+    pd.DataFrame(
+        {"UTD": ["ITAPOAN", "CAMACARI"], "BASE": ["B1", None], "ZONA": ["Z1", "Z2"], "TURMA": ["STC", "EPS"]}
+    ).to_csv(cache_path.with_suffix(".csv"), index=False)
+
+    ensure_cache(cache_path, fetcher=_unreachable_fetcher)
+
+    df = load_dag40(cache_path, connector=_unreachable_connector)
+    assert df["BASE"].tolist() == ["B1", ""]
+    assert df["UTD"].tolist() == ["ITAPOAN", "CAMACARI"]
+    assert (df.dtypes == "string").all()
+
+
+def test_csv_cache_path_is_served_from_parquet(tmp_path):
+    csv_path = tmp_path / "dag40_cache.csv"
+    pd.DataFrame({"UTD": ["ITAPOAN"], "BASE": ["B1"], "ZONA": ["Z1"], "TURMA": ["STC"]}).to_csv(
+        csv_path, index=False, encoding="utf-8-sig"
+    )
+
+    df = load_dag40(csv_path, connector=_unreachable_connector)
+
+    assert csv_path.with_suffix(".parquet").exists()
+    assert df["ZONA"].tolist() == ["Z1"]
+
+
+def test_dag40_lookups_keep_first_zona_and_sort_bases():
+    df = pd.DataFrame(
+        {
+            "UTD": ["ITAPOAN", "ITAPOAN", "ITAPOAN", "CAMACARI"],
+            "BASE": ["b2", "B1", "b2", ""],
+            "ZONA": ["Z1", "Z2", "Z3", "Z4"],
+            "TURMA": ["STC", "STC", "STC", "EPS"],
+        }
+    )
+
+    lookups = build_dag40_lookups(df)
+
+    assert lookups.zona_by_key[("ITAPOAN", "b2", "STC")] == "Z1"
+    assert lookups.bases_by_utd_turma == {("ITAPOAN", "STC"): ["B1", "b2"]}
+    assert lookups.utd_options == ("CAMACARI", "ITAPOAN")
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from app.services.hana import HanaPool
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+
+    def isconnected(self):
+        return self.connected
+
+    def close(self):
+        self.closed = True
+
+
+def _pool(created):
+    def factory():
+        conn = _FakeConnection()
+        created.append(conn)
+        return conn
+
+    return HanaPool(factory, size=2)
+
+
+def test_pool_reuses_idle_connection():
+    created = []
+    pool = _pool(created)
+
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        pass
+
+    assert first is second
+    assert len(created) == 1
+
+
+def test_lost_session_flushes_idle_connections():
+    created = []
+    pool = _pool(created)
+    with pool.acquire() as idle_a, pool.acquire() as idle_b:
+        pass
+
+    with pytest.raises(RuntimeError):
+        with pool.acquire() as conn:
+            conn.connected = False
+            raise RuntimeError("connection reset")
+
+    assert idle_a.closed and idle_b.closed
+    with pool.acquire() as fresh:
+        assert fresh not in (idle_a, idle_b)
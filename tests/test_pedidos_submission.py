@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from app.services.pedidos_submission import prepare_submission_dataframe
+from app.utils.time_windows import TZ
+
+
+def _lines_df(**overrides) -> pd.DataFrame:
+    data = {
+        "UTD": ["ITAPOAN", "ITAPOAN"],
+        "BASE": ["B1", "B2"],
+        "TURMA": ["STC", "STC"],
+        "GERACAO_PARA": [" hoje", "AMANHÃ "],
+        "SERVIÇO": ["Corte Gavião", "Corte Gavião"],
+        "PACOTES": [1, "2"],
+        "JUSTIFICATIVA": ["urgente", "rotina"],
+        "COMENTARIO": ["", None],
+        "ZONA": ["Z1", "Z1"],
+    }
+    data.update(overrides)
+    return pd.DataFrame(data)
+
+
+def test_prepare_submission_normalises_payload():
+    timestamp = datetime(2024, 1, 1, 9, 0, tzinfo=TZ)
+
+    out = prepare_submission_dataframe(
+        _lines_df(),
+        nome="José da Silva",
+        email=" Jose.Silva@neoenergia.com ",
+        turma="STC",
+        after_1055=False,
+        timestamp=timestamp,
+    )
+
+    assert out["TIMESTAMP"].tolist() == [timestamp, timestamp]
+    assert out["NOME"].tolist() == ["JOSE DA SILVA"] * 2
+    assert out["E-MAIL"].tolist() == ["jose.silva@neoenergia.com"] * 2
+    assert out["CADEIA"].tolist() == ["HOJE", "AMANHÃ"]
+    assert out["SERVICO_CLEAN"].tolist() == ["CORTE GAVIAO"] * 2
+    assert out["PACOTES"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"JUSTIFICATIVA": ["urgente", "  "]}, "JUSTIFICATIVA"),
+        ({"SERVIÇO": [None, "Corte Gavião"]}, "SERVIÇO"),
+        ({"GERACAO_PARA": ["HOJE", ""], "PACOTES": [1, None]}, "GERACAO_PARA"),
+        ({"GERACAO_PARA": ["AMANHÃ", "AMANHÃ"], "PACOTES": [1, 0]}, "PACOTES"),
+        ({}, "HOJE"),
+    ],
+)
+def test_prepare_submission_rejects_invalid_lines(overrides, message):
+    with pytest.raises(ValueError, match=message):
+        prepare_submission_dataframe(
+            _lines_df(**overrides),
+            nome="José da Silva",
+            email="jose.silva@neoenergia.com",
+            turma="STC",
+            after_1055=True,
+        )
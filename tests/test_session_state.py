@@ -1,60 +1,64 @@
 from __future__ import annotations
 
-import sys
-import types
-from pathlib import Path
-from types import SimpleNamespace
+import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+pytestmark = pytest.mark.usefixtures("streamlit_stub")
 
-streamlit_stub = types.ModuleType("streamlit")
-streamlit_stub.session_state = {}
 
+class _FakeStreamlit:
+    __slots__ = ("session_state", "rerun_called")
 
-def _noop() -> None:  # pragma: no cover - executed only if a test fails to patch ``st``
-    pass
-
-
-streamlit_stub.rerun = _noop
-sys.modules.setdefault("streamlit", streamlit_stub)
-
-from app.state import session
-from app.state import session_keys as keys
-
-
-class _FakeStreamlit(SimpleNamespace):
     def __init__(self) -> None:
-        super().__init__(session_state={}, rerun_called=False)
+        self.session_state = {}
+        self.rerun_called = False
 
     def rerun(self) -> None:  # pragma: no cover - invoked indirectly
         self.rerun_called = True
 
 
-def test_trigger_full_reset_sets_flag(monkeypatch):
-    fake_st = _FakeStreamlit()
-    monkeypatch.setattr(session, "st", fake_st)
+@pytest.fixture
+def session():
+    from app.state import session
 
-    session.trigger_full_reset()
+    return session
 
-    assert fake_st.session_state[keys.FULL_RESET_FLAG] is True
 
+@pytest.fixture
+def keys():
+    from app.state import session_keys
 
-def test_handle_full_reset_clears_state_and_reruns(monkeypatch):
-    fake_st = _FakeStreamlit()
-    fake_st.session_state[keys.FULL_RESET_FLAG] = True
-    monkeypatch.setattr(session, "st", fake_st)
+    return session_keys
+
+
+@pytest.fixture
+def fake_st(monkeypatch, session):
+    fake = _FakeStreamlit()
+    monkeypatch.setattr(session, "st", fake)
+    return fake
 
-    session.handle_full_reset()
 
-    assert fake_st.session_state == {keys.FULL_RESET_FLAG: False}
-    assert fake_st.rerun_called is True
+def test_trigger_full_reset_sets_flag(fake_st, session, keys):
+    session.trigger_full_reset()
+
+    assert fake_st.session_state[keys.FULL_RESET_FLAG] is True
 
 
-def test_handle_full_reset_no_flag(monkeypatch):
-    fake_st = _FakeStreamlit()
-    monkeypatch.setattr(session, "st", fake_st)
+@pytest.mark.parametrize(
+    ("preset_flag", "expected_flag", "expected_rerun"),
+    [
+        (None, None, False),
+        (True, False, True),
+    ],
+)
+def test_handle_full_reset(fake_st, session, keys, preset_flag, expected_flag, expected_rerun):
+    if preset_flag is not None:
+        fake_st.session_state[keys.FULL_RESET_FLAG] = preset_flag
 
     session.handle_full_reset()
 
-    assert fake_st.session_state == {}
-    assert fake_st.rerun_called is False
+    if expected_flag is None:
+        assert not fake_st.session_state
+    else:
+        assert fake_st.session_state.get(keys.FULL_RESET_FLAG) is expected_flag
+        assert len(fake_st.session_state) == 1
+    assert fake_st.rerun_called is expected_rerun
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pandas as pd
+
+from app.models.pedido import build_row_key_from_series, build_row_keys_vectorized
+from app.repositories.pedidos_repo import (
+    SQL_UPDATE_STATUS_VALIDADO,
+    PedidosFilter,
+    StatusChange,
+    as_param_rows,
+    build_status_changes,
+    fetch_filter_values,
+    fetch_pedidos,
+    insert_param_rows,
+    normalize_status,
+    update_statuses,
+)
+from app.services.hana import HanaConfig
+from app.utils.constants import Status
+
+
+def _pedidos_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "TIMESTAMP": ["2024-01-01 08:00:00", "2024-01-01 09:00:00", "2024-01-01 10:00:00"],
+            "NOME": ["MARIA SILVA", "JOAO SOUZA", "ANA LIMA"],
+            "E-MAIL": ["maria@neoenergia.com", "joao@neoenergia.com", "ana@neoenergia.com"],
+            "UTD": ["ITAPOAN", "ITAPOAN", "CAMACARI"],
+            "BASE": ["B1", "B2", "B3"],
+            "SERVICO": ["CORTE", "RECORTE", "BAIXA"],
+            "PACOTES": [1, 2, 3],
+            "STATUS": [Status.EM_ANALISE, Status.APROVADO, None],
+        }
+    )
+
+
+def test_build_status_changes_skips_unchanged_and_unknown_rows():
+    df = _pedidos_df()
+    row_keys = [build_row_key_from_series(row) for _, row in df.iterrows()]
+    pending = {
+        row_keys[0]: "🟢 Aprovado",
+        row_keys[1]: "🟢 Aprovado",
+        row_keys[2]: "🔴 Recusado",
+        "missing": "🟢 Aprovado",
+    }
+
+    changes = build_status_changes(df, pending, admin_email="adm@neoenergia.com", has_validado_por=True)
+
+    assert [(c.nome, c.status) for c in changes] == [
+        ("MARIA SILVA", Status.APROVADO),
+        ("ANA LIMA", Status.RECUSADO),
+    ]
+    assert all(c.validado_por == "adm@neoenergia.com" for c in changes)
+
+
+def test_build_status_changes_without_validado_por_column():
+    df = _pedidos_df()
+    row_key = build_row_key_from_series(df.iloc[1])
+
+    changes = build_status_changes(df, {row_key: "🟡 Pendente"}, admin_email="adm@neoenergia.com", has_validado_por=False)
+
+    assert len(changes) == 1
+    assert changes[0].status == Status.EM_ANALISE
+    assert changes[0].validado_por is None
+
+
+def test_normalize_status_folds_blanks_into_em_analise():
+    raw = pd.Series([" aprovado", None, "", "null", "RECUSADO"], dtype=object)
+
+    assert normalize_status(raw).tolist() == [
+        Status.APROVADO,
+        Status.EM_ANALISE,
+        Status.EM_ANALISE,
+        Status.EM_ANALISE,
+        Status.RECUSADO,
+    ]
+
+
+def test_build_status_changes_uses_precomputed_row_keys():
+    df = _pedidos_df()
+    row_keys = pd.Series(["k0", "k1", "k2"])
+
+    changes = build_status_changes(
+        df,
+        {"k2": "🟢 Aprovado"},
+        admin_email="adm@neoenergia.com",
+        has_validado_por=True,
+        row_keys=row_keys,
+    )
+
+    assert [(c.nome, c.status) for c in changes] == [("ANA LIMA", Status.APROVADO)]
+
+
+def test_build_status_changes_binds_null_text_as_none():
+    df = _pedidos_df().astype({"NOME": "string[pyarrow]"})
+    df.loc[0, "NOME"] = None
+    row_keys = pd.Series(["k0", "k1", "k2"])
+
+    changes = build_status_changes(
+        df,
+        {"k0": "🟢 Aprovado"},
+        admin_email="adm@neoenergia.com",
+        has_validado_por=True,
+        row_keys=row_keys,
+    )
+
+    params = as_param_rows(changes, has_validado_por=True)
+    assert params[0][3] is None
+
+
+def test_build_row_keys_vectorized_matches_row_builder():
+    df = _pedidos_df()
+    df["TIMESTAMP"] = pd.to_datetime(df["TIMESTAMP"])
+    df.loc[1, "NOME"] = None
+    df["PACOTES"] = ["2.7", None, 3]
+
+    expected = [build_row_key_from_series(row) for _, row in df.iterrows()]
+
+    assert build_row_keys_vectorized(df).tolist() == expected
+
+
+def test_as_param_rows_places_validado_por_after_status():
+    changes = [
+        StatusChange("ts", "NOME", "e@neoenergia.com", "UTD", "BASE", "CORTE", "2", Status.APROVADO, "adm"),
+        StatusChange("ts", "NOME", "e@neoenergia.com", "UTD", "BASE", "CORTE", 1, Status.EM_ANALISE),
+    ]
+
+    assert as_param_rows(changes, has_validado_por=True) == [
+        (Status.APROVADO, "adm", "ts", "NOME", "e@neoenergia.com", "UTD", "BASE", "CORTE", 2),
+        (Status.EM_ANALISE, None, "ts", "NOME", "e@neoenergia.com", "UTD", "BASE", "CORTE", 1),
+    ]
+    assert as_param_rows(changes[:1], has_validado_por=False) == [
+        (Status.APROVADO, "ts", "NOME", "e@neoenergia.com", "UTD", "BASE", "CORTE", 2),
+    ]
+
+
+def test_insert_param_rows_cleans_optional_text():
+    rows = pd.DataFrame(
+        {
+            "TIMESTAMP": ["ts", "ts"],
+            "NOME": ["MARIA SILVA", "MARIA SILVA"],
+            "E-MAIL": ["maria@neoenergia.com", "maria@neoenergia.com"],
+            "CADEIA": ["HOJE", "AMANHÃ"],
+            "UTD": ["ITAPOAN", "ITAPOAN"],
+            "BASE": ["B1", "B2"],
+            "TURMA": ["STC", "STC"],
+            "ZONA": ["Z1", "Z2"],
+            "SERVICO_CLEAN": ["CORTE", "BAIXA"],
+            "PACOTES": [2, 1],
+            "JUSTIFICATIVA": ["  urgente ", None],
+            "COMENTARIO": ["   ", "ok"],
+        }
+    )
+
+    with_turma = insert_param_rows(rows, has_turma=True)
+    without_turma = insert_param_rows(rows, has_turma=False)
+
+    assert with_turma[0] == (
+        "ts", "MARIA SILVA", "maria@neoenergia.com", "HOJE", "ITAPOAN", "B1", "STC", "Z1", "CORTE", 2, None, "urgente", None,
+    )
+    assert with_turma[1][-2:] == (None, "ok")
+    assert without_turma[1] == (
+        "ts", "MARIA SILVA", "maria@neoenergia.com", "AMANHÃ", "ITAPOAN", "B2", "Z2", "BAIXA", 1, None, None, "ok",
+    )
+
+
+class _RecordingCursor:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def executemany(self, sql, params):
+        self.calls.append((sql, params))
+
+    def close(self):
+        pass
+
+
+class _RecordingConnection:
+    def __init__(self):
+        self.calls = []
+        self.commits = 0
+
+    def cursor(self):
+        return _RecordingCursor(self.calls)
+
+    def commit(self):
+        self.commits += 1
+
+    def close(self):
+        pass
+
+
+def test_update_statuses_sends_one_batch():
+    conn = _RecordingConnection()
+    changes = [
+        StatusChange("ts", "NOME", "e@neoenergia.com", "UTD", "B1", "CORTE", 1, Status.APROVADO, "adm"),
+        StatusChange("ts", "NOME", "e@neoenergia.com", "UTD", "B2", "CORTE", 1, Status.RECUSADO, "adm"),
+    ]
+
+    updated = update_statuses(
+        changes,
+        connector=lambda **_kwargs: conn,
+        config=HanaConfig(host="test-update-statuses", port=30015, user="u", password="p"),
+        has_validado_por=True,
+    )
+
+    assert updated == 2
+    assert conn.calls == [(SQL_UPDATE_STATUS_VALIDADO, as_param_rows(changes, has_validado_por=True))]
+    assert conn.commits == 1
+
+
+class _QueryCursor:
+    def __init__(self, calls):
+        self.calls = calls
+        self.description = None
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        self.calls.append((sql, params))
+        if "SYS.TABLE_COLUMNS" in sql:
+            self._rows = [(col,) for col in ("TIMESTAMP", "E-MAIL", "UTD", "STATUS")]
+        else:
+            self.description = [("TIMESTAMP",), ("E-MAIL",), ("UTD",), ("STATUS",)]
+            self._rows = [("2024-01-01 08:00:00", "a_b@neoenergia.com", "ITAPOAN", Status.APROVADO)]
+
+    def fetchall(self):
+        return self._rows
+
+    def close(self):
+        pass
+
+
+def test_fetch_pedidos_pushes_filters_to_hana():
+    conn = _RecordingConnection()
+    conn.cursor = lambda: _QueryCursor(conn.calls)
+    filters = PedidosFilter(
+        day=date(2024, 1, 1),
+        utds=("ITAPOAN",),
+        statuses=(Status.APROVADO, Status.RECUSADO),
+        email_contains="a_b",
+    )
+
+    df = fetch_pedidos(
+        connector=lambda **_kwargs: conn,
+        config=HanaConfig(host="test-fetch-filters", port=30015, user="u", password="p"),
+        filters=filters,
+    )
+
+    sql, params = conn.calls[-1]
+    assert 'TO_DATE("TIMESTAMP") = ?' in sql
+    assert '"UTD" IN (?)' in sql
+    assert '"BASE" IN' not in sql
+    assert params == [date(2024, 1, 1), "ITAPOAN", Status.APROVADO, Status.RECUSADO, "%a\\_b%"]
+    assert df["UTD"].tolist() == ["ITAPOAN"]
+
+
+class _DistinctCursor(_QueryCursor):
+    def execute(self, sql, params=None):
+        self.calls.append((sql, params))
+        if 'DISTINCT "UTD"' in sql:
+            self._rows = [("CAMACARI",), ("ITAPOAN",)]
+        elif 'DISTINCT "BASE"' in sql:
+            self._rows = [("B1",)]
+        else:
+            self._rows = [(date(2024, 1, 2),)]
+
+
+def test_fetch_filter_values_uses_distinct_queries():
+    conn = _RecordingConnection()
+    conn.cursor = lambda: _DistinctCursor(conn.calls)
+
+    utds, bases, latest_day = fetch_filter_values(
+        connector=lambda **_kwargs: conn,
+        config=HanaConfig(host="test-filter-values", port=30015, user="u", password="p"),
+    )
+
+    assert (utds, bases, latest_day) == (["CAMACARI", "ITAPOAN"], ["B1"], date(2024, 1, 2))
+    assert len(conn.calls) == 3
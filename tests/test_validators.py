@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from app.utils.validators import (
+    is_valid_email,
+    is_valid_name,
+    normalize_email,
+    strip_accents,
+    strip_accents_and_punct_action,
+    strip_accents_and_punct_name,
+)
+
+
+def test_strip_accents_removes_diacritics():
+    assert strip_accents("João Conceição") == "Joao Conceicao"
+
+
+def test_strip_accents_ascii_input_is_returned_unchanged():
+    assert strip_accents("maria.silva@neoenergia.com") == "maria.silva@neoenergia.com"
+
+
+def test_strip_accents_handles_decomposed_input_and_non_strings():
+    assert strip_accents("Jose\u0301") == "Jose"
+    assert strip_accents(None) == ""
+
+
+def test_normalisers_uppercase_and_drop_punctuation():
+    assert strip_accents_and_punct_name("  joão   da-silva ") == "JOAO DA SILVA"
+    assert strip_accents_and_punct_action("Corte Gavião #2") == "CORTE GAVIAO 2"
+    assert strip_accents_and_punct_name(None) == ""
+
+
+def test_normalisers_fall_back_for_characters_outside_the_table():
+    assert strip_accents_and_punct_name("Ｊoão\u0301 ﬁlho ß") == "JOAO FILHO"
+    assert strip_accents_and_punct_action("Serviço Ⅱ ¼") == "SERVICO II 1 4"
+
+
+def test_is_valid_name_requires_two_words():
+    assert is_valid_name("Maria Silva")
+    assert not is_valid_name("Maria")
+    assert not is_valid_name(None)
+
+
+def test_is_valid_email_accepts_only_corporate_domain():
+    assert is_valid_email("  Maria.Silva@NEOENERGIA.com ")
+    assert not is_valid_email("maria@gmail.com")
+    assert not is_valid_email(None)
+
+
+def test_normalize_email_trims_and_lowercases():
+    assert normalize_email("  Maria.Silva@NEOENERGIA.com ") == "maria.silva@neoenergia.com"
+    assert normalize_email(None) == ""